@@ -21,7 +21,8 @@ from interfaces import (
     IAnalyzer,
     IRecognizer,
     IFakeDataGenerator,
-    ICacheStrategy
+    ICacheStrategy,
+    IEvictionPolicy
 )
 
 from monitoring import PerformanceMonitor
@@ -50,6 +51,7 @@ __all__ = [
     "IRecognizer", 
     "IFakeDataGenerator",
     "ICacheStrategy",
+    "IEvictionPolicy",
     
     # Utilities
     "PerformanceMonitor"
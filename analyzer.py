@@ -4,61 +4,208 @@ Implements async patterns with proper resource management and caching.
 """
 
 import asyncio
+import atexit
+import functools
+import os
 import threading
 import hashlib
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List, Optional
+import operator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from contextlib import asynccontextmanager
 
-from presidio_analyzer import AnalyzerEngine, RecognizerRegistry
-from presidio_analyzer.nlp_engine import NlpEngineProvider
+from presidio_analyzer import AnalyzerEngine, BatchAnalyzerEngine, RecognizerRegistry
+from presidio_analyzer.nlp_engine import NlpEngineProvider, SpacyNlpEngine
 
 from core import Language, EntityMatch
-from exceptions import AnalysisError
+from exceptions import AnalysisError, ProcessingError
 from interfaces import ICacheStrategy
 from recognizers_factory import RecognizerFactory
 
+# Presidio reads tokens, lemmas and entities only; the dependency parser is
+# never consumed. Lemmatizer prerequisites (tagger, attribute_ruler,
+# morphologizer) stay enabled because context enhancement matches on lemmas.
+DISABLED_SPACY_COMPONENTS = tuple(
+    name.strip()
+    for name in os.environ.get('SPACY_DISABLED_COMPONENTS', 'parser').split(',')
+    if name.strip()
+)
+
+# Concurrency comes from the executor, not from intra-op threading, so torch
+# is limited to one thread where analyzers are created. Set to false when
+# other code in the process relies on torch's default thread count
+PIN_ANALYZER_THREADS = os.environ.get('PIN_ANALYZER_THREADS', 'true').lower() == 'true'
+
+_threads_pinned = False
+
+# Process-wide pool of loaded analyzers so short-lived engines (one per
+# facade call) don't reload the large spaCy models
+_analyzer_pool: Dict[Tuple[str, FrozenSet[str]], AnalyzerEngine] = {}
+_analyzer_pool_lock = threading.RLock()
+
+
+def _pin_threads() -> None:
+    """Limit torch to one intra-op thread, once per process, if installed.
+    
+    BLAS/OpenMP size their thread pools when numpy loads, which happens on
+    import here; set OMP_NUM_THREADS and friends before starting the process.
+    """
+    global _threads_pinned
+    if _threads_pinned:
+        return
+    _threads_pinned = True
+    try:
+        import torch
+    except ImportError:
+        return
+    torch.set_num_threads(1)
+
+
+class PrunedSpacyNlpEngine(SpacyNlpEngine):
+    """spaCy NLP engine that switches off unused pipeline components"""
+    
+    def load(self) -> None:
+        super().load()
+        for model in self.models:
+            nlp = self.nlp[model["lang_code"]]
+            for component in model.get("disable", ()):
+                if component in nlp.pipe_names:
+                    nlp.disable_pipe(component)
+
+
+@functools.lru_cache(maxsize=128)
+def _entities_key(entities: Tuple[str, ...]) -> str:
+    """Memoized sorted entity list used as the cache key suffix"""
+    return ",".join(sorted(entities))
+
+
+# Fields read from each presidio RecognizerResult, in EntityMatch order
+_result_fields = operator.attrgetter('entity_type', 'start', 'end', 'score')
+
+# Per-process engine used when analysis runs in a ProcessPoolExecutor
+_worker_engine: Optional['AsyncPIIAnalyzerEngine'] = None
+
+
+# Process pools outlive the engines using them, so each worker loads spaCy
+# once rather than once per request
+_process_pools: Dict[Tuple[int, Optional[str]], ProcessPoolExecutor] = {}
+_process_pools_lock = threading.Lock()
+
+
+def _init_worker_engine(language_code: Optional[str] = None) -> None:
+    """Process pool initializer: build one uncached engine per worker.
+    
+    The analyzer for language_code is loaded up front so the first task a
+    worker runs doesn't pay for the spaCy model load.
+    """
+    global _worker_engine
+    _pin_threads()
+    from cache import NoCacheStrategy
+    _worker_engine = AsyncPIIAnalyzerEngine(NoCacheStrategy())
+    if language_code is not None:
+        _worker_engine._get_or_create_analyzer(Language(language_code))
+
+
+def _get_process_pool(max_workers: int, language_code: Optional[str]) -> ProcessPoolExecutor:
+    """Shared process pool per worker count and preloaded language"""
+    pool_key = (max_workers, language_code)
+    pool = _process_pools.get(pool_key)
+    if pool is None:
+        with _process_pools_lock:
+            pool = _process_pools.get(pool_key)
+            if pool is None:
+                pool = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_worker_engine,
+                    initargs=(language_code,)
+                )
+                _process_pools[pool_key] = pool
+    return pool
+
+
+@atexit.register
+def _shutdown_process_pools() -> None:
+    """Stop the shared worker processes when the interpreter exits"""
+    with _process_pools_lock:
+        pools = list(_process_pools.values())
+        _process_pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True)
+
+
+def _analyze_in_worker(text: str, language_code: str, entities: List[str]) -> List[EntityMatch]:
+    """Picklable entry point for single-text analysis in a worker process"""
+    return _worker_engine._analyze_sync_internal(text, Language(language_code), entities)
+
+
+def _analyze_batch_in_worker(texts: List[str], language_code: str, entities: List[str]) -> List[List[EntityMatch]]:
+    """Picklable entry point for batch analysis in a worker process"""
+    return _worker_engine._analyze_batch_sync_internal(texts, Language(language_code), entities)
+
 
 class AsyncPIIAnalyzerEngine:
     """Async analyzer engine with proper resource management"""
     
-    def __init__(self, cache_strategy: Optional[ICacheStrategy] = None):
+    def __init__(
+        self,
+        cache_strategy: Optional[ICacheStrategy] = None,
+        max_workers: int = 4,
+        use_processes: bool = False,
+        language: Optional[Language] = None
+    ):
         from cache import ThreadSafeLRUCache
         from redis_cache import RedisCache
         
-        self._analyzers: Dict[str, AnalyzerEngine] = {}
-        self._analyzer_lock = threading.RLock()
         self._cache = cache_strategy if cache_strategy is not None else ThreadSafeLRUCache(maxsize=1000)
-        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor: Optional[Executor] = None
+        self._max_workers = max_workers
+        self._use_processes = use_processes
+        # Process-pool workers preload this language's analyzer
+        self._language = language
+        # A no-op cache never hits, so skip hashing the text for its key
+        self._cache_enabled = getattr(self._cache, 'enabled', True)
+        self._batch_size = int(os.environ.get('SPACY_BATCH_SIZE', 32))
         
     async def __aenter__(self):
         """Async context manager entry"""
-        self._executor = ThreadPoolExecutor(max_workers=4)
+        if self._use_processes:
+            # spaCy holds the GIL for most of NER, so processes scale across
+            # cores; the pool is shared and stays up after this engine exits
+            language_code = self._language.value if self._language else None
+            self._executor = _get_process_pool(self._max_workers, language_code)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
         if self._executor:
-            self._executor.shutdown(wait=True)
+            if not self._use_processes:
+                self._executor.shutdown(wait=True)
             self._executor = None
     
     def _get_cache_key(self, text: str, language: Language, entities: List[str]) -> str:
         """Generate cache key"""
-        text_hash = hashlib.md5(text.encode()).hexdigest()
-        entities_str = ",".join(sorted(entities))
-        return f"{text_hash}_{language.value}_{entities_str}"
+        text_hash = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+        return f"{text_hash}_{language.value}_{_entities_key(tuple(entities))}"
     
     def _get_or_create_analyzer(self, language: Language) -> AnalyzerEngine:
-        """Thread-safe lazy initialization of analyzers"""
-        lang_code = language.value
-        if lang_code not in self._analyzers:
-            with self._analyzer_lock:
-                if lang_code not in self._analyzers:
-                    self._analyzers[lang_code] = self._create_analyzer(language)
-        return self._analyzers[lang_code]
+        """Thread-safe lazy initialization of analyzers shared across engines"""
+        pool_key = (language.value, frozenset(DISABLED_SPACY_COMPONENTS))
+        analyzer = _analyzer_pool.get(pool_key)
+        if analyzer is None:
+            with _analyzer_pool_lock:
+                analyzer = _analyzer_pool.get(pool_key)
+                if analyzer is None:
+                    analyzer = self._create_analyzer(language)
+                    _analyzer_pool[pool_key] = analyzer
+        return analyzer
     
     def _create_analyzer(self, language: Language) -> AnalyzerEngine:
         """Create analyzer with large spaCy models and all recognizers"""
+        if PIN_ANALYZER_THREADS:
+            _pin_threads()
+        
         registry = RecognizerRegistry()
         registry.load_predefined_recognizers(languages=[language.value])
         
@@ -71,11 +218,18 @@ class AsyncPIIAnalyzerEngine:
         model_name = f"{language.value}_core_news_lg"  # Keep large models
         nlp_config = {
             "nlp_engine_name": "spacy",
-            "models": [{"lang_code": language.value, "model_name": model_name}],
+            "models": [{
+                "lang_code": language.value,
+                "model_name": model_name,
+                "disable": list(DISABLED_SPACY_COMPONENTS),
+            }],
         }
         
         try:
-            provider = NlpEngineProvider(nlp_configuration=nlp_config)
+            provider = NlpEngineProvider(
+                nlp_engines=(PrunedSpacyNlpEngine,),
+                nlp_configuration=nlp_config
+            )
             nlp_engine = provider.create_engine()
         except Exception as e:
             raise AnalysisError(f"Failed to create NLP engine for {language.value}: {str(e)}")
@@ -95,27 +249,89 @@ class AsyncPIIAnalyzerEngine:
         """Async analysis with caching"""
         
         # Check cache first
-        cache_key = self._get_cache_key(text, language, entities)
-        cached_result = self._cache.get(cache_key)
-        if cached_result is not None:
-            return cached_result
+        cache_key = None
+        if self._cache_enabled:
+            cache_key = self._get_cache_key(text, language, entities)
+            cached_result = self._cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result
         
         # Perform analysis in thread pool
         if not self._executor:
-            from .exceptions import ProcessingError
             raise ProcessingError("Analyzer not properly initialized. Use async context manager.")
         
         loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(
-            self._executor,
-            self._analyze_sync_internal,
-            text, language, entities
-        )
+        if self._use_processes:
+            result = await loop.run_in_executor(
+                self._executor,
+                _analyze_in_worker,
+                text, language.value, list(entities)
+            )
+        else:
+            result = await loop.run_in_executor(
+                self._executor,
+                self._analyze_sync_internal,
+                text, language, entities
+            )
         
         # Cache the result
-        self._cache.set(cache_key, result)
+        if cache_key is not None:
+            self._cache.set(cache_key, result)
         return result
     
+    async def analyze_batch_async(
+        self,
+        texts: List[str],
+        language: Language,
+        entities: List[str]
+    ) -> List[List[EntityMatch]]:
+        """Async batch analysis through spaCy's nlp.pipe with per-text caching"""
+        # Serve whatever we can from cache, collect the rest for one batch
+        if self._cache_enabled:
+            cache_keys = [self._get_cache_key(text, language, entities) for text in texts]
+            # Caches with a batched lookup (e.g. Redis MGET) take one round trip
+            get_many = getattr(self._cache, 'get_many', None)
+            if get_many is not None:
+                results = list(get_many(cache_keys))
+            else:
+                results = [self._cache.get(cache_key) for cache_key in cache_keys]
+        else:
+            cache_keys = [None] * len(texts)
+            results = [None] * len(texts)
+        pending = [index for index, result in enumerate(results) if result is None]
+        
+        if not pending:
+            return results
+        
+        if not self._executor:
+            raise ProcessingError("Analyzer not properly initialized. Use async context manager.")
+        
+        pending_texts = [texts[index] for index in pending]
+        loop = asyncio.get_running_loop()
+        if self._use_processes:
+            batch_results = await loop.run_in_executor(
+                self._executor,
+                _analyze_batch_in_worker,
+                pending_texts, language.value, list(entities)
+            )
+        else:
+            batch_results = await loop.run_in_executor(
+                self._executor,
+                self._analyze_batch_sync_internal,
+                pending_texts, language, entities
+            )
+        
+        for index, result in zip(pending, batch_results):
+            results[index] = result
+        if self._cache_enabled:
+            set_many = getattr(self._cache, 'set_many', None)
+            if set_many is not None:
+                set_many({cache_keys[index]: results[index] for index in pending})
+            else:
+                for index in pending:
+                    self._cache.set(cache_keys[index], results[index])
+        return results
+    
     def _analyze_sync_internal(
         self,
         text: str,
@@ -130,16 +346,37 @@ class AsyncPIIAnalyzerEngine:
                 entities=entities,
                 language=language.value
             )
-            
+            return self._to_entity_matches(text, results)
+        except Exception as e:
+            raise AnalysisError(f"Analysis failed: {str(e)}")
+    
+    def _analyze_batch_sync_internal(
+        self,
+        texts: List[str],
+        language: Language,
+        entities: List[str]
+    ) -> List[List[EntityMatch]]:
+        """Internal synchronous batch analysis"""
+        try:
+            analyzer = self._get_or_create_analyzer(language)
+            batch_results = BatchAnalyzerEngine(analyzer).analyze_iterator(
+                texts,
+                language=language.value,
+                batch_size=self._batch_size,
+                entities=entities
+            )
             return [
-                EntityMatch(
-                    entity_type=result.entity_type,
-                    start=result.start,
-                    end=result.end,
-                    text=text[result.start:result.end],
-                    confidence=result.score
-                )
-                for result in results
+                self._to_entity_matches(text, results)
+                for text, results in zip(texts, batch_results)
             ]
         except Exception as e:
-            raise AnalysisError(f"Analysis failed: {str(e)}")
\ No newline at end of file
+            raise AnalysisError(f"Batch analysis failed: {str(e)}")
+    
+    @staticmethod
+    def _to_entity_matches(text: str, results) -> List[EntityMatch]:
+        """Convert presidio results into EntityMatch objects"""
+        make_match = EntityMatch._from_presidio
+        return [
+            make_match(entity_type, start, end, text[start:end], score)
+            for entity_type, start, end, score in map(_result_fields, results)
+        ]
\ No newline at end of file
@@ -4,49 +4,249 @@ Implements the Strategy pattern for different caching approaches.
 """
 
 import os
+import random
 import threading
-from typing import Optional, Any
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Any
+
+from exceptions import ConfigurationError
+from interfaces import ICacheStrategy, IEvictionPolicy
+
+_MISS = object()
 
 
 class ThreadSafeLRUCache:
     """Thread-safe LRU cache implementation"""
     
     def __init__(self, maxsize: int = None):
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = maxsize or int(os.environ.get('CACHE_MAX_SIZE', 1000))
+    
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            value = self._cache.get(key, _MISS)
+            if value is _MISS:
+                return None
+            # Move to end (most recently used)
+            self._cache.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            # Assignment keeps an existing key's position, so always refresh it
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.maxsize:
+                # Remove least recently used
+                self._cache.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+class LRUPolicy:
+    """Evict the least recently used key; admit everything"""
+    
+    def __init__(self, maxsize: int = None):
+        self._order = OrderedDict()
+    
+    def record(self, key: Hashable) -> None:
+        pass
+    
+    def on_access(self, key: Hashable) -> None:
+        self._order.move_to_end(key)
+    
+    def on_insert(self, key: Hashable) -> None:
+        self._order[key] = None
+    
+    def on_remove(self, key: Hashable) -> None:
+        del self._order[key]
+    
+    def select_victim(self) -> Hashable:
+        return next(iter(self._order))
+    
+    def admit(self, key: Hashable, victim: Hashable) -> bool:
+        return True
+    
+    def clear(self) -> None:
+        self._order.clear()
+
+
+class _CountMinSketch:
+    """Count-min sketch with 4-bit saturating counters and periodic halving"""
+    
+    _DEPTH = 4
+    _SEEDS = (0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F)
+    _MAX_COUNT = 15
+    
+    def __init__(self, width: int):
+        size = 1
+        while size < width:
+            size <<= 1
+        self._mask = size - 1
+        self._rows = [bytearray(size) for _ in range(self._DEPTH)]
+        self._sample_size = width
+        self._additions = 0
+    
+    def _indexes(self, key: Hashable):
+        key_hash = hash(key)
+        return [((key_hash * seed) >> 7) & self._mask for seed in self._SEEDS]
+    
+    def increment(self, key: Hashable) -> None:
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < self._MAX_COUNT:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._halve()
+    
+    def estimate(self, key: Hashable) -> int:
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+    
+    def _halve(self) -> None:
+        """Age all counters so old popularity fades out"""
+        self._rows = [bytearray(count >> 1 for count in row) for row in self._rows]
+        self._additions //= 2
+    
+    def clear(self) -> None:
+        for row in self._rows:
+            row[:] = bytes(len(row))
+        self._additions = 0
+
+
+class TinyLFUPolicy(LRUPolicy):
+    """LRU eviction order with TinyLFU frequency-based admission"""
+    
+    def __init__(self, maxsize: int = None):
+        super().__init__(maxsize)
+        self._sketch = _CountMinSketch((maxsize or 1000) * 10)
+    
+    def record(self, key: Hashable) -> None:
+        self._sketch.increment(key)
+    
+    def admit(self, key: Hashable, victim: Hashable) -> bool:
+        return self._sketch.estimate(key) > self._sketch.estimate(victim)
+    
+    def clear(self) -> None:
+        super().clear()
+        self._sketch.clear()
+
+
+class TwoRandomPolicy:
+    """Sample two cached keys and evict the less recently used one"""
+    
+    def __init__(self, maxsize: int = None):
+        self._keys: List[Hashable] = []
+        self._positions: Dict[Hashable, int] = {}
+        self._last_access: Dict[Hashable, int] = {}
+        self._clock = 0
+        self._random = random.Random()
+    
+    def _touch(self, key: Hashable) -> None:
+        self._clock += 1
+        self._last_access[key] = self._clock
+    
+    def record(self, key: Hashable) -> None:
+        pass
+    
+    def on_access(self, key: Hashable) -> None:
+        self._touch(key)
+    
+    def on_insert(self, key: Hashable) -> None:
+        self._positions[key] = len(self._keys)
+        self._keys.append(key)
+        self._touch(key)
+    
+    def on_remove(self, key: Hashable) -> None:
+        # Swap-remove keeps random sampling O(1)
+        position = self._positions.pop(key)
+        last_key = self._keys.pop()
+        if last_key != key:
+            self._keys[position] = last_key
+            self._positions[last_key] = position
+        del self._last_access[key]
+    
+    def select_victim(self) -> Hashable:
+        first = self._random.choice(self._keys)
+        second = self._random.choice(self._keys)
+        if self._last_access[first] <= self._last_access[second]:
+            return first
+        return second
+    
+    def admit(self, key: Hashable, victim: Hashable) -> bool:
+        return True
+    
+    def clear(self) -> None:
+        self._keys.clear()
+        self._positions.clear()
+        self._last_access.clear()
+
+
+EVICTION_POLICIES = {
+    "lru": LRUPolicy,
+    "tinylfu": TinyLFUPolicy,
+    "two_random": TwoRandomPolicy,
+}
+
+
+class ThreadSafePolicyCache:
+    """Thread-safe bounded cache with a pluggable eviction policy"""
+    
+    def __init__(self, maxsize: int = None, policy: Optional[IEvictionPolicy] = None):
         self._cache = {}
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
         self.maxsize = maxsize or int(os.environ.get('CACHE_MAX_SIZE', 1000))
-        self._access_order = []
+        self._policy = policy if policy is not None else LRUPolicy(self.maxsize)
     
     def get(self, key: str) -> Optional[Any]:
         with self._lock:
-            if key in self._cache:
-                # Move to end (most recently used)
-                self._access_order.remove(key)
-                self._access_order.append(key)
-                return self._cache[key]
-            return None
+            self._policy.record(key)
+            value = self._cache.get(key, _MISS)
+            if value is _MISS:
+                return None
+            self._policy.on_access(key)
+            return value
     
     def set(self, key: str, value: Any) -> None:
         with self._lock:
             if key in self._cache:
-                self._access_order.remove(key)
-            elif len(self._cache) >= self.maxsize:
-                # Remove least recently used
-                oldest = self._access_order.pop(0)
-                del self._cache[oldest]
+                self._cache[key] = value
+                self._policy.on_access(key)
+                return
+            
+            if len(self._cache) >= self.maxsize:
+                victim = self._policy.select_victim()
+                if not self._policy.admit(key, victim):
+                    return
+                del self._cache[victim]
+                self._policy.on_remove(victim)
             
             self._cache[key] = value
-            self._access_order.append(key)
+            self._policy.on_insert(key)
     
     def clear(self) -> None:
         with self._lock:
             self._cache.clear()
-            self._access_order.clear()
+            self._policy.clear()
+
+
+def create_cache_strategy(policy: str = "lru", maxsize: int = None) -> ICacheStrategy:
+    """Create an in-memory cache for the named eviction policy"""
+    if policy == "lru":
+        return ThreadSafeLRUCache(maxsize)
+    if policy not in EVICTION_POLICIES:
+        raise ConfigurationError(f"Unknown cache policy: {policy}")
+    size = maxsize or int(os.environ.get('CACHE_MAX_SIZE', 1000))
+    return ThreadSafePolicyCache(size, EVICTION_POLICIES[policy](size))
 
 
 class NoCacheStrategy:
     """No-op cache for when caching is disabled"""
     
+    enabled = False
+    
     def get(self, key: str) -> Optional[Any]:
         return None
     
@@ -54,4 +254,4 @@ class NoCacheStrategy:
         pass
     
     def clear(self) -> None:
-        pass
\ No newline at end of file
+        pass
@@ -19,7 +19,7 @@ class Language(Enum):
     GERMAN = "de"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntityMatch:
     """Immutable representation of a detected PII entity"""
     entity_type: str
@@ -34,6 +34,24 @@ class EntityMatch:
         if not 0 <= self.confidence <= 1:
             raise ValueError("Confidence must be between 0 and 1")
 
+    @classmethod
+    def _from_presidio(
+        cls,
+        entity_type: str,
+        start: int,
+        end: int,
+        text: str,
+        confidence: float
+    ) -> "EntityMatch":
+        """Build a match from trusted analyzer output, skipping validation"""
+        self = object.__new__(cls)
+        object.__setattr__(self, "entity_type", entity_type)
+        object.__setattr__(self, "start", start)
+        object.__setattr__(self, "end", end)
+        object.__setattr__(self, "text", text)
+        object.__setattr__(self, "confidence", confidence)
+        return self
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "entity_type": self.entity_type,
@@ -44,7 +62,7 @@ class EntityMatch:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnonymizedEntity:
     """Immutable representation of an anonymized entity"""
     entity_id: str
@@ -75,6 +93,8 @@ class ProcessingConfig:
     max_workers: int = None
     chunk_size: int = None
     cache_enabled: bool = None
+    cache_policy: str = None
+    use_process_pool: bool = None
     
     def __post_init__(self):
         import os
@@ -98,6 +118,12 @@ class ProcessingConfig:
             
         if self.cache_enabled is None:
             self.cache_enabled = os.environ.get('CACHE_ENABLED', 'true').lower() == 'true'
+            
+        if self.cache_policy is None:
+            self.cache_policy = os.environ.get('CACHE_POLICY', 'lru').lower()
+            
+        if self.use_process_pool is None:
+            self.use_process_pool = os.environ.get('USE_PROCESS_POOL', 'false').lower() == 'true'
     
         # Validate configuration
         if not 0 <= self.confidence_threshold <= 1:
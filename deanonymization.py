@@ -3,12 +3,20 @@ Deanonymization service for restoring original PII values.
 Implements Single Responsibility Principle for deanonymization operations.
 """
 
-from typing import Dict, Union, Any
+import functools
+import re
+from typing import Dict, Tuple, Union, Any
 
 from core import AnonymizedEntity, ProcessingResult
 from exceptions import ProcessingError
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_fake_values(fake_values: Tuple[str, ...]) -> re.Pattern:
+    """Compile (and memoize) one alternation over all fake values, in order"""
+    return re.compile("|".join(map(re.escape, fake_values)))
+
+
 class DeanonymizationService:
     """Service for deanonymizing text"""
     
@@ -39,13 +47,19 @@ class DeanonymizationService:
             # Sort by fake value length (longest first) to avoid partial replacements
             processed_entities.sort(key=lambda x: len(x["fake_value"]), reverse=True)
             
-            # Replace fake values with originals
+            replacements = {}
             for entity in processed_entities:
-                if entity["fake_value"] in original_text:
-                    original_text = original_text.replace(
-                        entity["fake_value"], 
-                        entity["original_value"]
-                    )
+                if entity["fake_value"]:
+                    replacements.setdefault(entity["fake_value"], entity["original_value"])
+            
+            # Replace all fake values in a single pass; the alternation is ordered
+            # longest first so the longest fake wins at any given position
+            if replacements:
+                pattern = _compile_fake_values(tuple(replacements))
+                original_text = pattern.sub(
+                    lambda match: replacements[match.group(0)],
+                    original_text
+                )
             
             return ProcessingResult(
                 anonymized_data=original_text,
@@ -57,4 +71,4 @@ class DeanonymizationService:
             )
             
         except Exception as e:
-            raise ProcessingError(f"Deanonymization failed: {str(e)}")
\ No newline at end of file
+            raise ProcessingError(f"Deanonymization failed: {str(e)}")
@@ -5,6 +5,10 @@ This module loads environment variables from a .env file if it exists.
 
 import os
 from pathlib import Path
+from typing import Dict
+
+# Modification time of each .env file already applied to os.environ
+_loaded_env_files: Dict[str, float] = {}
 
 
 def load_env_file(env_path=None):
@@ -15,19 +19,30 @@ def load_env_file(env_path=None):
     """
     if env_path is None:
         env_path = Path(os.path.dirname(os.path.abspath(__file__))) / '.env'
+    env_path = os.fspath(env_path)
+    
+    try:
+        mtime = os.path.getmtime(env_path)
+    except OSError:
+        return
     
-    if not os.path.exists(env_path):
+    # Skip re-parsing a file that hasn't changed since it was last applied
+    if _loaded_env_files.get(env_path) == mtime:
         return
     
     with open(env_path, 'r') as f:
         for line in f:
             line = line.strip()
-            if not line or line.startswith('#'):
+            if not line or line[0] == '#':
                 continue
             
-            key, value = line.split('=', 1)
+            key, separator, value = line.partition('=')
+            if not separator:
+                continue
             os.environ[key.strip()] = value.strip()
+    
+    _loaded_env_files[env_path] = mtime
 
 
 # Load environment variables when module is imported
-load_env_file()
\ No newline at end of file
+load_env_file()
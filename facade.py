@@ -11,7 +11,7 @@ from core import Language, ProcessingConfig, ProcessingResult, AnonymizedEntity
 from processing import AsyncPIIProcessingEngine
 from deanonymization import DeanonymizationService
 from analyzer import AsyncPIIAnalyzerEngine
-from cache import ThreadSafeLRUCache, NoCacheStrategy
+from cache import NoCacheStrategy, create_cache_strategy
 from recognizers_factory import RecognizerFactory
 
 
@@ -108,7 +108,9 @@ class ArchitecturalPIIAnonymizer:
         entities_to_analyze = (entities_to_find or 
                              RecognizerFactory.get_all_supported_entities(language))
         
-        cache_strategy = ThreadSafeLRUCache() if cache_enabled else NoCacheStrategy()
+        cache_strategy = (
+            create_cache_strategy(config.cache_policy) if config.cache_enabled else NoCacheStrategy()
+        )
         
         async with AsyncPIIAnalyzerEngine(cache_strategy) as analyzer:
             entities = await analyzer.analyze_async(text, language, entities_to_analyze)
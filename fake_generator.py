@@ -1,26 +1,69 @@
-import secrets
+import functools
 import hashlib
-from typing import Dict, Callable, Optional
-from faker import Faker
+import threading
+from string import ascii_uppercase
+from typing import TYPE_CHECKING, Dict, Callable, Optional
 
 from core import Language
 
+if TYPE_CHECKING:
+    from faker import Faker
+
+
+@functools.lru_cache(maxsize=4096)
+def _entity_id(entity_type: str, original_value: str) -> str:
+    """Deterministic entity ID, memoized for values repeated across a document"""
+    hash_input = f"{entity_type}:{original_value}"
+    entity_hash = hashlib.blake2b(hash_input.encode(), digest_size=4).hexdigest()
+    return f"{entity_type}_{entity_hash}"
+
+
+def _consistent_seed(original_value: str) -> int:
+    """Seed derived from the value itself, stable across processes unlike hash()"""
+    return int.from_bytes(hashlib.blake2b(original_value.encode(), digest_size=4).digest(), "little")
+
+
+def _new_faker(locale: str) -> "Faker":
+    """Faker with its own RNG; faker itself is imported on first use"""
+    from faker import Faker
+    fake = Faker(locale)
+    # Detach from the module-level Random that all Faker instances share
+    fake.seed_instance()
+    return fake
+
+
+@functools.lru_cache(maxsize=8)
+def _get_faker(locale: str) -> "Faker":
+    """Process-wide Faker per locale"""
+    return _new_faker(locale)
+
+
+# Per-thread generators for consistent values, each on a private Faker
+_seeded = threading.local()
+
 
 class FakeDataGenerator:
     """Enhanced fake data generator with Faker library support"""
     
-    def __init__(self, language: Language = Language.ENGLISH):
+    def __init__(self, language: Language = Language.ENGLISH, fake: Optional["Faker"] = None):
         self.language = language
         # Initialize Faker with appropriate locale
-        self.fake = self._create_faker_instance()
+        self.fake = fake if fake is not None else self._create_faker_instance()
+        # Fake values need no cryptographic randomness; draw tokens from the
+        # Faker RNG so consistent generation covers them as well
+        self._random = self.fake.random
         self._generators = self._create_generators()
     
-    def _create_faker_instance(self) -> Faker:
+    def _create_faker_instance(self) -> "Faker":
         """Create Faker instance with appropriate locale"""
+        return _get_faker(self._locale())
+    
+    def _locale(self) -> str:
+        """Faker locale for the generator's language"""
         if self.language == Language.GERMAN:
-            return Faker('de_DE')
+            return 'de_DE'
         else:
-            return Faker('en_US')
+            return 'en_US'
     
     def generate_fake_value(
         self,
@@ -40,57 +83,61 @@ class FakeDataGenerator:
     
     def generate_entity_id(self, entity_type: str, original_value: str) -> str:
         """Generate unique ID - keeping original logic"""
-        hash_input = f"{entity_type}:{original_value}"
-        entity_hash = hashlib.sha256(hash_input.encode()).hexdigest()[:8]
-        return f"{entity_type}_{entity_hash}"
+        return _entity_id(entity_type, original_value)
     
     def _generate_default_value(self, entity_type: str, original_value: str) -> str:
         """Generate default value - keeping original logic"""
-        return f"[{entity_type}_{secrets.token_hex(4)}]"
+        return f"[{entity_type}_{self._token_hex(4)}]"
+    
+    def _token_hex(self, nbytes: int) -> str:
+        """Non-cryptographic random hex string of nbytes bytes"""
+        return self._random.randbytes(nbytes).hex()
     
     def _create_generators(self) -> Dict[str, Callable]:
         """Create enhanced fake value generators using Faker"""
+        # Bind Faker methods directly so each draw skips a lambda frame
+        fake = self.fake
         generators = {
             # Enhanced universal generators with Faker
-            "PERSON": lambda: self.fake.name(),
-            "FIRST_NAME": lambda: self.fake.first_name(),
-            "LAST_NAME": lambda: self.fake.last_name(),
-            "EMAIL_ADDRESS": lambda: self.fake.email(),
-            "PHONE_NUMBER": lambda: self.fake.phone_number(),
-            "CREDIT_CARD": lambda: self.fake.credit_card_number(),
-            "IP_ADDRESS": lambda: self.fake.ipv4(),
-            "IPV6_ADDRESS": lambda: self.fake.ipv6(),
-            "LOCATION": lambda: self.fake.city(),
-            "ADDRESS": lambda: self.fake.address().replace('\n', ', '),
-            "STREET_ADDRESS": lambda: self.fake.street_address(),
-            "CITY": lambda: self.fake.city(),
-            "STATE": lambda: self.fake.state(),
-            "COUNTRY": lambda: self.fake.country(),
-            "POSTAL_CODE": lambda: self.fake.postcode(),
-            "URL": lambda: self.fake.url(),
-            "DOMAIN": lambda: self.fake.domain_name(),
-            "DATE_TIME": lambda: self.fake.date_time().strftime("%Y-%m-%d %H:%M:%S"),
-            "DATE": lambda: self.fake.date(),
-            "TIME": lambda: self.fake.time(),
-            "BIRTH_DATE": lambda: self.fake.date_of_birth().strftime("%Y-%m-%d"),
-            "IBAN_CODE": lambda: self.fake.iban(),
-            "CRYPTO_WALLET": lambda: f"1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa{secrets.token_hex(4)}",
-            "MEDICAL_LICENSE": lambda: f"MD{self.fake.random_number(digits=7, fix_len=True)}",
-            "NRP": lambda: f"GROUP_{secrets.token_hex(3)}",
-            "PROFESSIONAL_LICENSE": lambda: f"LIC{self.fake.random_number(digits=6, fix_len=True)}",
-            "SSN": lambda: self.fake.ssn(),
-            "COMPANY": lambda: self.fake.company(),
-            "JOB_TITLE": lambda: self.fake.job(),
-            "USERNAME": lambda: self.fake.user_name(),
-            "PASSWORD": lambda: self.fake.password(),
-            "UUID": lambda: str(self.fake.uuid4()),
-            "MAC_ADDRESS": lambda: self.fake.mac_address(),
-            "USER_AGENT": lambda: self.fake.user_agent(),
-            "BANK_ACCOUNT": lambda: self.fake.bban(),
-            "SWIFT_CODE": lambda: self.fake.swift(),
-            "CURRENCY_CODE": lambda: self.fake.currency_code(),
-            "LICENSE_PLATE": lambda: self.fake.license_plate(),
-            "VIN": lambda: self.fake.vin() if hasattr(self.fake, 'vin') else f"VIN{secrets.token_hex(8).upper()}",
+            "PERSON": fake.name,
+            "FIRST_NAME": fake.first_name,
+            "LAST_NAME": fake.last_name,
+            "EMAIL_ADDRESS": fake.email,
+            "PHONE_NUMBER": fake.phone_number,
+            "CREDIT_CARD": fake.credit_card_number,
+            "IP_ADDRESS": fake.ipv4,
+            "IPV6_ADDRESS": fake.ipv6,
+            "LOCATION": fake.city,
+            "ADDRESS": lambda: fake.address().replace('\n', ', '),
+            "STREET_ADDRESS": fake.street_address,
+            "CITY": fake.city,
+            "STATE": fake.state,
+            "COUNTRY": fake.country,
+            "POSTAL_CODE": fake.postcode,
+            "URL": fake.url,
+            "DOMAIN": fake.domain_name,
+            "DATE_TIME": lambda: fake.date_time().strftime("%Y-%m-%d %H:%M:%S"),
+            "DATE": fake.date,
+            "TIME": fake.time,
+            "BIRTH_DATE": lambda: fake.date_of_birth().strftime("%Y-%m-%d"),
+            "IBAN_CODE": fake.iban,
+            "CRYPTO_WALLET": lambda: f"1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa{self._token_hex(4)}",
+            "MEDICAL_LICENSE": lambda: f"MD{fake.random_number(digits=7, fix_len=True)}",
+            "NRP": lambda: f"GROUP_{self._token_hex(3)}",
+            "PROFESSIONAL_LICENSE": lambda: f"LIC{fake.random_number(digits=6, fix_len=True)}",
+            "SSN": fake.ssn,
+            "COMPANY": fake.company,
+            "JOB_TITLE": fake.job,
+            "USERNAME": fake.user_name,
+            "PASSWORD": fake.password,
+            "UUID": lambda: str(fake.uuid4()),
+            "MAC_ADDRESS": fake.mac_address,
+            "USER_AGENT": fake.user_agent,
+            "BANK_ACCOUNT": fake.bban,
+            "SWIFT_CODE": fake.swift,
+            "CURRENCY_CODE": fake.currency_code,
+            "LICENSE_PLATE": fake.license_plate,
+            "VIN": lambda: fake.vin() if hasattr(fake, 'vin') else f"VIN{self._token_hex(8).upper()}",
         }
         
         # Add language-specific generators
@@ -103,72 +150,100 @@ class FakeDataGenerator:
     
     def _create_english_generators(self) -> Dict[str, Callable]:
         """Create English-specific generators"""
+        fake = self.fake
         return {
-            "US_SSN": lambda: self.fake.ssn(),
-            "US_PHONE": lambda: self.fake.phone_number(),
-            "US_STATE": lambda: self.fake.state(),
-            "US_ZIP_CODE": lambda: self.fake.zipcode(),
-            "UK_POSTCODE": lambda: self.fake.postcode() if 'GB' in str(self.fake) else f"{self.fake.lexify('??')} {self.fake.numerify('#??')}",
-            "DRIVER_LICENSE": lambda: f"D{self.fake.random_number(digits=8)}",
+            "US_SSN": fake.ssn,
+            "US_PHONE": fake.phone_number,
+            "US_STATE": fake.state,
+            "US_ZIP_CODE": fake.zipcode,
+            "UK_POSTCODE": lambda: fake.postcode() if 'GB' in str(fake) else f"{fake.lexify('??')} {fake.numerify('#??')}",
+            "DRIVER_LICENSE": lambda: f"D{fake.random_number(digits=8)}",
         }
     
     def _create_german_generators(self) -> Dict[str, Callable]:
         """Create German-specific generators with enhanced Faker support"""
+        fake = self.fake
+        # Number formats draw straight from the RNG into prebuilt %-templates
+        # instead of one Faker random_number() call per component
+        rng = self._random
+        randint = rng.randint
+        choice = rng.choice
         return {
             # Keep original custom German generators for specific formats
-            "DE_TAX_ID": lambda: f"{self.fake.random_number(digits=11)}",
-            "DE_PENSION_INSURANCE": lambda: f"{self.fake.random_number(digits=2, fix_len=True)}{self.fake.random_number(digits=6, fix_len=True)}A{self.fake.random_number(digits=3, fix_len=True)}",
-            "DE_HEALTH_INSURANCE": lambda: f"A{self.fake.random_number(digits=10, fix_len=True)}",
-            "DE_VAT_ID": lambda: f"DE{self.fake.random_number(digits=9, fix_len=True)}",
-            "DE_IBAN": lambda: self.fake.iban(),
-            "DE_PHONE_NUMBER": lambda: self.fake.phone_number(),
-            "DE_COMPANY_TAX": lambda: f"{self.fake.random_number(digits=3)}/{self.fake.random_number(digits=3)}/{self.fake.random_number(digits=5)}",
-            "DE_COMMERCIAL_REGISTER": lambda: f"HR{self.fake.random_element(['A', 'B'])}{self.fake.random_number(digits=5)}",
-            "BIC_SWIFT": lambda: self.fake.swift(),
-            "DE_STREET_ADDRESS": lambda: self.fake.street_address(),
-            "DE_ID_CARD": lambda: f"{self.fake.random_letter().upper()}{self.fake.random_number(digits=8, fix_len=True)}",
-            "DE_PASSPORT": lambda: f"{self.fake.random_letter().upper()}{self.fake.random_letter().upper()}{self.fake.random_number(digits=7, fix_len=True)}",
-            "DE_DRIVING_LICENSE": lambda: f"DE{self.fake.random_number(digits=8, fix_len=True)}" if self.fake.boolean() else f"{self.fake.random_number(digits=11, fix_len=True)}",
-            "DE_RESIDENCE_PERMIT": lambda: f"{self.fake.random_letter().upper()}{self.fake.random_number(digits=9, fix_len=True)}{self.fake.random_letter().upper()}{self.fake.random_number(digits=1)}",
-            "DE_BANK_ACCOUNT": lambda: f"{self.fake.random_number(digits=10, fix_len=True)}",
-            "DE_SOCIAL_SECURITY": lambda: f"{self.fake.random_number(digits=2, fix_len=True)}{self.fake.random_number(digits=6, fix_len=True)}A{self.fake.random_number(digits=3, fix_len=True)}",
-            "DE_DATE_OF_BIRTH": lambda: self.fake.date_of_birth(minimum_age=18, maximum_age=80).strftime("%d.%m.%Y"),
-            "DE_PERSON_NAME": lambda: self.fake.name(),
-            "DE_FIRST_NAME": lambda: self.fake.first_name(),
-            "DE_LAST_NAME": lambda: self.fake.last_name(),
-            "DE_CREDIT_CARD": lambda: self.fake.credit_card_number(),
-            "DE_CUSTOMER_ID": lambda: f"CUST-{self.fake.random_number(digits=6, fix_len=True)}",
-            "DE_EXPIRY_DATE": lambda: f"{self.fake.random_number(digits=2, fix_len=True)}/{self.fake.random_number(digits=2, fix_len=True)}",
-            "DE_POSTAL_CODE": lambda: self.fake.postcode(),
-            "DE_STREET_NAME": lambda: f"{self.fake.word().capitalize()}{self.fake.random_element(['straße', 'gasse', 'weg', 'platz'])}",
-            "DE_CITY": lambda: self.fake.city(),
-            "DE_STATE": lambda: self.fake.state(),
-            "DE_COMPANY": lambda: self.fake.company(),
-            "DE_EMAIL": lambda: self.fake.email(),
-            "DE_USERNAME": lambda: self.fake.user_name(),
-            "DE_URL": lambda: self.fake.url(),
-            "DE_DOMAIN": lambda: self.fake.domain_name(),
+            "DE_TAX_ID": lambda: "%d" % randint(0, 99999999999),
+            "DE_PENSION_INSURANCE": lambda: "%d%dA%d" % (randint(10, 99), randint(100000, 999999), randint(100, 999)),
+            "DE_HEALTH_INSURANCE": lambda: "A%d" % randint(1000000000, 9999999999),
+            "DE_VAT_ID": lambda: "DE%d" % randint(100000000, 999999999),
+            "DE_IBAN": fake.iban,
+            "DE_PHONE_NUMBER": fake.phone_number,
+            "DE_COMPANY_TAX": lambda: "%d/%d/%d" % (randint(0, 999), randint(0, 999), randint(0, 99999)),
+            "DE_COMMERCIAL_REGISTER": lambda: "HR%s%d" % (choice('AB'), randint(0, 99999)),
+            "BIC_SWIFT": fake.swift,
+            "DE_STREET_ADDRESS": fake.street_address,
+            "DE_ID_CARD": lambda: "%s%d" % (choice(ascii_uppercase), randint(10000000, 99999999)),
+            "DE_PASSPORT": lambda: "%s%s%d" % (choice(ascii_uppercase), choice(ascii_uppercase), randint(1000000, 9999999)),
+            "DE_DRIVING_LICENSE": lambda: "DE%d" % randint(10000000, 99999999) if rng.random() < 0.5 else "%d" % randint(10000000000, 99999999999),
+            "DE_RESIDENCE_PERMIT": lambda: "%s%d%s%d" % (choice(ascii_uppercase), randint(100000000, 999999999), choice(ascii_uppercase), randint(0, 9)),
+            "DE_BANK_ACCOUNT": lambda: "%d" % randint(1000000000, 9999999999),
+            "DE_SOCIAL_SECURITY": lambda: "%d%dA%d" % (randint(10, 99), randint(100000, 999999), randint(100, 999)),
+            "DE_DATE_OF_BIRTH": lambda: fake.date_of_birth(minimum_age=18, maximum_age=80).strftime("%d.%m.%Y"),
+            "DE_PERSON_NAME": fake.name,
+            "DE_FIRST_NAME": fake.first_name,
+            "DE_LAST_NAME": fake.last_name,
+            "DE_CREDIT_CARD": fake.credit_card_number,
+            "DE_CUSTOMER_ID": lambda: "CUST-%d" % randint(100000, 999999),
+            "DE_EXPIRY_DATE": lambda: "%d/%d" % (randint(10, 99), randint(10, 99)),
+            "DE_POSTAL_CODE": fake.postcode,
+            "DE_STREET_NAME": lambda: f"{fake.word().capitalize()}{fake.random_element(['straße', 'gasse', 'weg', 'platz'])}",
+            "DE_CITY": fake.city,
+            "DE_STATE": fake.state,
+            "DE_COMPANY": fake.company,
+            "DE_EMAIL": fake.email,
+            "DE_USERNAME": fake.user_name,
+            "DE_URL": fake.url,
+            "DE_DOMAIN": fake.domain_name,
         }
     
     def get_available_entity_types(self) -> list:
         """Get list of all available entity types"""
         return list(self._generators.keys())
     
+    def _seeded_generator(self) -> "FakeDataGenerator":
+        """This thread's generator on a private Faker, safe to reseed per value.
+        
+        The shared per-locale Faker is used by every thread, so seeding its
+        RNG would race with their draws.
+        """
+        try:
+            generators = _seeded.generators
+        except AttributeError:
+            generators = _seeded.generators = {}
+        generator = generators.get(self.language)
+        if generator is None:
+            generator = FakeDataGenerator(self.language, _new_faker(self._locale()))
+            generators[self.language] = generator
+        return generator
+    
     def generate_consistent_fake_value(self, entity_type: str, original_value: str) -> str:
         """Generate consistent fake value for the same original value"""
-        # Use original value as seed for consistent generation
-        self.fake.seed_instance(hash(original_value))
-        fake_value = self.generate_fake_value(entity_type, original_value)
-        # Reset seed
-        self.fake.seed_instance(None)
-        return fake_value
+        seeded = self._seeded_generator()
+        seeded._random.seed(_consistent_seed(original_value))
+        return seeded.generate_fake_value(entity_type, original_value)
     
     def bulk_generate(self, entity_mappings: Dict[str, str], consistent: bool = True) -> Dict[str, str]:
         """Generate fake values for multiple entities at once"""
+        if not consistent:
+            generate = self.generate_fake_value
+            return {
+                original_value: generate(entity_type, original_value)
+                for entity_type, original_value in entity_mappings.items()
+            }
+        
+        seeded = self._seeded_generator()
+        seed = seeded._random.seed
+        generate = seeded.generate_fake_value
         results = {}
         for entity_type, original_value in entity_mappings.items():
-            if consistent:
-                results[original_value] = self.generate_consistent_fake_value(entity_type, original_value)
-            else:
-                results[original_value] = self.generate_fake_value(entity_type, original_value)
+            seed(_consistent_seed(original_value))
+            results[original_value] = generate(entity_type, original_value)
         return results
\ No newline at end of file
@@ -3,7 +3,7 @@ Interfaces and protocols for the PII anonymizer module.
 Implements the Interface Segregation Principle from SOLID.
 """
 
-from typing import List, Any, Optional, Callable, Protocol
+from typing import Hashable, List, Any, Optional, Callable, Protocol
 from abc import ABC, abstractmethod
 
 from core import Language, EntityMatch
@@ -58,4 +58,36 @@ class ICacheStrategy(Protocol):
     
     def clear(self) -> None:
         """Clear cache"""
+        ...
+
+
+class IEvictionPolicy(Protocol):
+    """Interface for cache eviction/admission policies"""
+    
+    def record(self, key: Hashable) -> None:
+        """Record a lookup of key, hit or miss"""
+        ...
+    
+    def on_access(self, key: Hashable) -> None:
+        """Notify that a cached key was read or updated"""
+        ...
+    
+    def on_insert(self, key: Hashable) -> None:
+        """Notify that key was added to the cache"""
+        ...
+    
+    def on_remove(self, key: Hashable) -> None:
+        """Notify that key was removed from the cache"""
+        ...
+    
+    def select_victim(self) -> Hashable:
+        """Choose the cached key to evict next"""
+        ...
+    
+    def admit(self, key: Hashable, victim: Hashable) -> bool:
+        """Decide whether key should replace victim in a full cache"""
+        ...
+    
+    def clear(self) -> None:
+        """Forget all tracked keys"""
         ...
\ No newline at end of file
@@ -4,6 +4,7 @@ Tracks metrics and provides performance analysis capabilities.
 """
 
 import time
+from array import array
 from typing import Dict, List, Any
 
 from core import ProcessingResult
@@ -13,40 +14,63 @@ class PerformanceMonitor:
     """Monitor performance metrics"""
     
     def __init__(self):
-        self.metrics: List[Dict[str, Any]] = []
+        # One typed column per metric instead of a dict per record
+        self._timestamps = array('d')
+        self._processing_times = array('d')
+        self._text_lengths = array('q')
+        self._entities_found = array('q')
+        self._cache_hits = array('q')
+    
+    @property
+    def metrics(self) -> List[Dict[str, Any]]:
+        """Recorded metrics as one dict per processed text"""
+        return [
+            {
+                "timestamp": timestamp,
+                "processing_time": processing_time,
+                "text_length": text_length,
+                "entities_found": entities_found,
+                "cache_hits": cache_hits
+            }
+            for timestamp, processing_time, text_length, entities_found, cache_hits in zip(
+                self._timestamps, self._processing_times, self._text_lengths,
+                self._entities_found, self._cache_hits
+            )
+        ]
     
     def record_processing(self, result: ProcessingResult):
         """Record processing metrics"""
-        self.metrics.append({
-            "timestamp": time.time(),
-            "processing_time": result.processing_time,
-            "text_length": result.metadata.get("text_length", 0),
-            "entities_found": result.total_entities,
-            "cache_hits": result.cache_hits
-        })
+        self._timestamps.append(time.time())
+        self._processing_times.append(result.processing_time)
+        self._text_lengths.append(result.metadata.get("text_length", 0))
+        self._entities_found.append(result.total_entities)
+        self._cache_hits.append(result.cache_hits)
     
     def get_average_performance(self) -> Dict[str, float]:
         """Get average performance metrics"""
-        if not self.metrics:
+        count = len(self._processing_times)
+        if not count:
             return {}
         
-        total_time = sum(m["processing_time"] for m in self.metrics)
-        total_length = sum(m["text_length"] for m in self.metrics)
+        total_time = sum(self._processing_times)
+        total_length = sum(self._text_lengths)
         
         return {
-            "avg_processing_time": total_time / len(self.metrics),
+            "avg_processing_time": total_time / count,
             "chars_per_second": total_length / total_time if total_time > 0 else 0,
-            "avg_entities_per_text": sum(m["entities_found"] for m in self.metrics) / len(self.metrics)
+            "avg_entities_per_text": sum(self._entities_found) / count
         }
     
     def clear_metrics(self):
         """Clear all recorded metrics"""
-        self.metrics.clear()
+        for column in (self._timestamps, self._processing_times, self._text_lengths,
+                       self._entities_found, self._cache_hits):
+            del column[:]
     
     def get_total_processed(self) -> int:
         """Get total number of texts processed"""
-        return len(self.metrics)
+        return len(self._processing_times)
     
     def get_total_entities_found(self) -> int:
         """Get total number of entities found across all processing"""
-        return sum(m["entities_found"] for m in self.metrics)
\ No newline at end of file
+        return sum(self._entities_found)
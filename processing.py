@@ -3,30 +3,38 @@ Main processing engine implementing the Facade pattern.
 Orchestrates the entire PII anonymization process.
 """
 
+import functools
 import time
+from itertools import islice
+from operator import attrgetter
 from typing import Dict, List, Tuple
 
 from core import Language, ProcessingConfig, ProcessingResult, EntityMatch, AnonymizedEntity
 from exceptions import ProcessingError
-from cache import ThreadSafeLRUCache, NoCacheStrategy
+from cache import NoCacheStrategy, create_cache_strategy
 from analyzer import AsyncPIIAnalyzerEngine
 from fake_generator import FakeDataGenerator
 from recognizers_factory import RecognizerFactory
 
 
+@functools.lru_cache(maxsize=8)
+def _get_cached_fake_generator(language: Language) -> FakeDataGenerator:
+    """Process-wide fake data generator per language, shared by all engines"""
+    return FakeDataGenerator(language)
+
+
 class AsyncPIIProcessingEngine:
     """Main processing engine implementing Facade pattern"""
     
     def __init__(self, config: ProcessingConfig):
         self.config = config
-        self._cache_strategy = ThreadSafeLRUCache() if config.cache_enabled else NoCacheStrategy()
-        self._fake_generators: Dict[Language, FakeDataGenerator] = {}
+        self._cache_strategy = (
+            create_cache_strategy(config.cache_policy) if config.cache_enabled else NoCacheStrategy()
+        )
     
     def _get_fake_generator(self, language: Language) -> FakeDataGenerator:
         """Get or create fake data generator for language"""
-        if language not in self._fake_generators:
-            self._fake_generators[language] = FakeDataGenerator(language)
-        return self._fake_generators[language]
+        return _get_cached_fake_generator(language)
     
     async def process_text_async(self, text: str) -> ProcessingResult:
         """Main async processing method"""
@@ -37,7 +45,12 @@ class AsyncPIIProcessingEngine:
             entities_to_analyze = self._get_entities_to_analyze()
             
             # Analyze text asynchronously
-            async with AsyncPIIAnalyzerEngine(self._cache_strategy) as analyzer:
+            async with AsyncPIIAnalyzerEngine(
+                self._cache_strategy,
+                max_workers=self.config.max_workers,
+                use_processes=self.config.use_process_pool,
+                language=self.config.language
+            ) as analyzer:
                 detected_entities = await analyzer.analyze_async(
                     text=text,
                     language=self.config.language,
@@ -77,24 +90,26 @@ class AsyncPIIProcessingEngine:
     
     def _filter_entities(self, entities: List[EntityMatch]) -> List[EntityMatch]:
         """Filter entities by confidence threshold"""
-        return [e for e in entities if e.confidence >= self.config.confidence_threshold]
+        threshold = self.config.confidence_threshold
+        return [e for e in entities if e.confidence >= threshold]
     
     def _merge_overlapping_entities(self, entities: List[EntityMatch]) -> List[EntityMatch]:
         """Merge overlapping entities keeping higher confidence ones"""
         if not entities:
             return []
         
-        sorted_entities = sorted(entities, key=lambda x: x.start)
-        merged = [sorted_entities[0]]
+        sorted_entities = sorted(entities, key=attrgetter('start'))
+        last = sorted_entities[0]
+        merged = [last]
         
-        for current in sorted_entities[1:]:
-            last = merged[-1]
+        for current in islice(sorted_entities, 1, None):
             if current.start < last.end:
                 # Overlap detected - keep higher confidence
                 if current.confidence > last.confidence:
-                    merged[-1] = current
+                    merged[-1] = last = current
             else:
                 merged.append(current)
+                last = current
         
         return merged
     
@@ -103,22 +118,23 @@ class AsyncPIIProcessingEngine:
         text: str, 
         entities: List[EntityMatch]
     ) -> Tuple[str, Dict[str, AnonymizedEntity]]:
-        """Anonymize detected entities"""
+        """Anonymize detected entities.
+        
+        Expects non-overlapping entities sorted by start offset, as returned
+        by _merge_overlapping_entities.
+        """
         fake_generator = self._get_fake_generator(self.config.language)
+        custom_generators = self.config.custom_fake_generators or {}
         entities_map = {}
-        anonymized_text = text
+        parts = []
+        position = 0
         
-        # Sort by start position in reverse order for safe replacement
-        sorted_entities = sorted(entities, key=lambda x: x.start, reverse=True)
-        
-        for entity in sorted_entities:
+        # Walk entities left to right and assemble the output in one pass
+        for entity in entities:
             entity_id = fake_generator.generate_entity_id(entity.entity_type, entity.text)
             
             # Get custom generator if provided
-            custom_generator = None
-            if (self.config.custom_fake_generators and 
-                entity.entity_type in self.config.custom_fake_generators):
-                custom_generator = self.config.custom_fake_generators[entity.entity_type]
+            custom_generator = custom_generators.get(entity.entity_type)
             
             fake_value = fake_generator.generate_fake_value(
                 entity.entity_type, entity.text, custom_generator
@@ -135,11 +151,10 @@ class AsyncPIIProcessingEngine:
             
             entities_map[entity_id] = anonymized_entity
             
-            # Replace in text
-            anonymized_text = (
-                anonymized_text[:entity.start] +
-                fake_value +
-                anonymized_text[entity.end:]
-            )
+            # Emit the untouched text before the entity, then its replacement
+            parts.append(text[position:entity.start])
+            parts.append(fake_value)
+            position = entity.end
         
-        return anonymized_text, entities_map
\ No newline at end of file
+        parts.append(text[position:])
+        return "".join(parts), entities_map
\ No newline at end of file
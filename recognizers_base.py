@@ -3,17 +3,331 @@ Base recognizer classes implementing the Open/Closed Principle.
 Abstract base class for all recognizers with common functionality.
 """
 
+import functools
+import logging
+from bisect import bisect_right
 from abc import ABC, abstractmethod
-from typing import List
-from presidio_analyzer import PatternRecognizer
+from typing import Iterable, List, Optional
+
+import regex
+from presidio_analyzer import EntityRecognizer, Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer import pattern_recognizer as _presidio_pattern_recognizer
+
+logger = logging.getLogger(__name__)
+
+# PatternRecognizer's default global_regex_flags
+PATTERN_RECOGNIZER_FLAGS = regex.DOTALL | regex.MULTILINE | regex.IGNORECASE
+
+# Per-pattern timeout presidio applies to its own matching (newer releases)
+REGEX_TIMEOUT_SECONDS = getattr(_presidio_pattern_recognizer, "REGEX_TIMEOUT_SECONDS", None)
+
+_IGNORECASE = regex.IGNORECASE
+_REGEX_ERROR = regex.error
+_UPPERCASE_ESCAPE = regex.compile(r"\\[A-Z]")
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_pattern(expression: str, flags: int) -> "regex.Pattern":
+    """Compile a regex once per process, shared by every recognizer instance"""
+    return regex.compile(expression, flags)
+
+
+class PrecompiledPattern(Pattern):
+    """Pattern handed to presidio already compiled.
+    
+    Presidio compiles each Pattern lazily on its first analysis. Compiling
+    up front moves that cost off the first request and shares one compiled
+    regex across analyzers and recognizer rebuilds.
+    
+    Pattern.__init__ is not called: it validates with stdlib re, which
+    rejects syntax the matching engine supports, such as atomic groups on
+    Python 3.10. Compiling with the regex module validates instead.
+    """
+    
+    def __init__(self, name: str, regex: str, score: float):
+        if score < 0 or score > 1:
+            raise ValueError(
+                f"Invalid score: {score}. Score should be between 0 and 1"
+            )
+        try:
+            compiled = _compile_pattern(regex, PATTERN_RECOGNIZER_FLAGS)
+        except _REGEX_ERROR as e:
+            raise ValueError(f"Invalid regex pattern: {e}")
+        self.name = name
+        self.regex = regex
+        self.score = score
+        self.compiled_regex = compiled
+        self.compiled_with_flags = PATTERN_RECOGNIZER_FLAGS
+
+
+def _lowercase(text: str) -> Optional[str]:
+    """Lowercase a text for the case-folded patterns scanning it.
+    
+    Returns None beyond Latin-1, where str.lower() and the regex engine's
+    case folding disagree for a few characters (e.g. 'ſ', or 'İ' whose
+    lowercase form is two characters long and would shift offsets).
+    """
+    if not text.isascii():
+        try:
+            text.encode("latin-1")
+        except UnicodeEncodeError:
+            return None
+    return text.lower()
+
+
+class _LowercaseScanner:
+    """Stands in for a compiled regex, matching against the lowercased text.
+    
+    Patterns with the same expression share one scanner. It holds no
+    texts; FastPatternRecognizer lowercases each text once per analysis
+    and hands it to scan().
+    """
+    
+    __slots__ = ("_lowered", "_fallback")
+    
+    def __init__(self, lowered: "regex.Pattern", fallback: "regex.Pattern"):
+        self._lowered = lowered
+        self._fallback = fallback
+    
+    def scan(self, text: str, lowered: Optional[str], **kwargs) -> tuple:
+        """Matches in text, given its _lowercase() form"""
+        if lowered is None:
+            return tuple(self._fallback.finditer(text, **kwargs))
+        return tuple(self._lowered.finditer(lowered, **kwargs))
+    
+    def finditer(self, text: str, *args, **kwargs):
+        lowered = _lowercase(text)
+        if lowered is None:
+            return self._fallback.finditer(text, *args, **kwargs)
+        return self._lowered.finditer(lowered, *args, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_scanner(
+    lowered: str, flags: int, fallback: "regex.Pattern"
+) -> _LowercaseScanner:
+    """One scanner per distinct expression and flags"""
+    return _LowercaseScanner(_compile_pattern(lowered, flags), fallback)
+
+
+class CaseFoldedPattern(PrecompiledPattern):
+    """PrecompiledPattern matched case-sensitively against lowercased text.
+    
+    Presidio matches with IGNORECASE, which makes the regex module fold
+    every character it compares. Lowercasing the pattern and the text
+    instead gives the same matches several times faster. Patterns using
+    uppercase escapes such as \\D or \\W cannot be lowercased and keep the
+    case-insensitive regex.
+    
+    Keywords, if given, are literals of which every match contains at least
+    one; FastPatternRecognizer skips the pattern for texts containing none.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        regex: str,
+        score: float,
+        keywords: Iterable[str] = ()
+    ):
+        super().__init__(name=name, regex=regex, score=score)
+        self.keywords = tuple(keyword.lower() for keyword in keywords)
+        if _UPPERCASE_ESCAPE.search(regex):
+            return
+        lowered = regex.lower()
+        if lowered.startswith("(?i)"):
+            lowered = lowered[len("(?i)"):]
+        self.compiled_regex = _shared_scanner(
+            lowered, PATTERN_RECOGNIZER_FLAGS & ~_IGNORECASE, self.compiled_regex
+        )
+
+
+class FastPatternRecognizer(PatternRecognizer):
+    """PatternRecognizer with a leaner matching loop.
+    
+    Presidio's loop times and logs every pattern, calls the
+    validate/invalidate hooks on every match and holds the GIL while
+    matching. Here the pattern fields are flattened into a table once, the
+    hooks, which these recognizers do not override, are skipped and the
+    GIL is released during matching. Results, explanations and metadata
+    are built the same way presidio builds them; other regex flags or
+    subclasses with hooks use presidio's loop.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        cls = type(self)
+        has_hooks = (
+            cls.validate_result is not PatternRecognizer.validate_result
+            or cls.invalidate_result is not PatternRecognizer.invalidate_result
+        )
+        compiled_flags = {pattern.compiled_with_flags for pattern in self.patterns}
+        if has_hooks or len(compiled_flags) != 1 or not all(
+            pattern.compiled_regex for pattern in self.patterns
+        ):
+            self._table_flags = None
+        else:
+            self._table_flags = compiled_flags.pop()
+        # Patterns scoring at or below MIN_SCORE never produce results
+        self._pattern_table = tuple(
+            (
+                pattern.compiled_regex,
+                pattern.name,
+                pattern.regex,
+                pattern.score,
+                getattr(pattern, "keywords", ()),
+            )
+            for pattern in self.patterns
+            if pattern.score > EntityRecognizer.MIN_SCORE
+        )
+    
+    def analyze(
+        self,
+        text: str,
+        entities: List[str],
+        nlp_artifacts=None,
+        regex_flags: Optional[int] = None
+    ) -> List[RecognizerResult]:
+        flags = regex_flags if regex_flags else self.global_regex_flags
+        if flags != self._table_flags:
+            return super().analyze(text, entities, nlp_artifacts, regex_flags)
+        
+        name = self.name
+        entity_type = self.supported_entities[0]
+        metadata = {
+            RecognizerResult.RECOGNIZER_NAME_KEY: name,
+            RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
+        }
+        build_explanation = self.build_regex_explanation
+        # Texts beyond Latin-1 are not lowercased and scan every pattern.
+        # The lowered text and shared scans live for this call only
+        lowered = _lowercase(text)
+        scans = {}
+        results = []
+        append = results.append
+        for compiled, pattern_name, expression, score, keywords in self._pattern_table:
+            if keywords and lowered is not None and not any(
+                keyword in lowered for keyword in keywords
+            ):
+                continue
+            try:
+                # concurrent=True releases the GIL while matching, so analyses
+                # running on the analyzer's thread pool overlap their scans
+                if type(compiled) is _LowercaseScanner:
+                    matches = scans.get(compiled)
+                    if matches is None:
+                        matches = scans[compiled] = compiled.scan(
+                            text, lowered, concurrent=True, timeout=REGEX_TIMEOUT_SECONDS
+                        )
+                else:
+                    matches = compiled.finditer(
+                        text, concurrent=True, timeout=REGEX_TIMEOUT_SECONDS
+                    )
+                for match in matches:
+                    start, end = match.span()
+                    if start == end:
+                        continue
+                    append(RecognizerResult(
+                        entity_type=entity_type,
+                        start=start,
+                        end=end,
+                        score=score,
+                        analysis_explanation=build_explanation(
+                            name, pattern_name, expression, score, None, flags
+                        ),
+                        recognition_metadata=dict(metadata),
+                    ))
+            except TimeoutError:
+                logger.warning(
+                    "Regex pattern '%s' timed out after %s seconds, skipping.",
+                    pattern_name,
+                    REGEX_TIMEOUT_SECONDS,
+                    exc_info=True,
+                )
+        
+        return self._remove_duplicates(results)
+    
+    @staticmethod
+    def _remove_duplicates(results: List[RecognizerResult]) -> List[RecognizerResult]:
+        """Same output as EntityRecognizer.remove_duplicates for one entity type.
+        
+        Presidio compares each result against every kept one, which is
+        quadratic in the match count. Results are ranked the same way
+        (score desc, start asc, longer first); within a score level a
+        running max end detects containment, and earlier levels are
+        searched by bisecting their starts.
+        """
+        unique = {}
+        for result in results:
+            if result.score > EntityRecognizer.MIN_SCORE:
+                # First occurrence wins, as with presidio's set()
+                unique.setdefault((result.start, result.end, result.score), result)
+        ranked = sorted(
+            unique.values(),
+            key=lambda r: (-r.score, r.start, r.start - r.end)
+        )
+        
+        kept = []
+        finished_levels = []
+        level_score = None
+        level_starts: List[int] = []
+        level_max_ends: List[int] = []
+        for result in ranked:
+            start, end = result.start, result.end
+            if result.score != level_score:
+                if level_starts:
+                    finished_levels.append((level_starts, level_max_ends))
+                level_score = result.score
+                level_starts, level_max_ends = [], []
+            elif level_max_ends and level_max_ends[-1] >= end:
+                continue
+            contained = False
+            for starts, max_ends in finished_levels:
+                index = bisect_right(starts, start)
+                if index and max_ends[index - 1] >= end:
+                    contained = True
+                    break
+            if contained:
+                continue
+            kept.append(result)
+            level_starts.append(start)
+            level_max_ends.append(max(end, level_max_ends[-1]) if level_max_ends else end)
+        return kept
+
+
+class KeywordGatedRecognizer(FastPatternRecognizer):
+    """PatternRecognizer that only runs its regexes when a keyword occurs.
+    
+    For recognizers whose every pattern starts with one of a few literal
+    words, a case-insensitive substring check over the text is far cheaper
+    than running each pattern, and most texts contain none of the words.
+    Keywords must cover every pattern, otherwise matches are lost.
+    """
+    
+    def __init__(self, *args, keywords: Iterable[str], **kwargs):
+        super().__init__(*args, **kwargs)
+        self._keywords = tuple(keyword.lower() for keyword in keywords)
+    
+    def analyze(
+        self,
+        text: str,
+        entities: List[str],
+        nlp_artifacts=None,
+        regex_flags: Optional[int] = None
+    ) -> List[RecognizerResult]:
+        lowered = _lowercase(text)
+        if lowered is None:
+            lowered = text.lower()
+        if not any(keyword in lowered for keyword in self._keywords):
+            return []
+        return super().analyze(text, entities, nlp_artifacts, regex_flags)
 
 
 class BaseRecognizer(ABC):
     """Abstract base for all recognizers"""
     
-    def __init__(self):
-        self._recognizers = None
-        self._supported_entities = None
+    # Slotted instances have no per-instance __dict__
+    __slots__ = ("_recognizers", "_supported_entities")
     
     @abstractmethod
     def _create_recognizers(self) -> List[PatternRecognizer]:
@@ -27,12 +341,17 @@ class BaseRecognizer(ABC):
     
     def get_recognizers(self) -> List[PatternRecognizer]:
         """Lazy initialization of recognizers"""
-        if self._recognizers is None:
+        try:
+            return self._recognizers
+        except AttributeError:
+            # Slot is unset until first use
             self._recognizers = self._create_recognizers()
-        return self._recognizers
+            return self._recognizers
     
     def get_supported_entities(self) -> List[str]:
         """Lazy initialization of supported entities"""
-        if self._supported_entities is None:
+        try:
+            return self._supported_entities
+        except AttributeError:
             self._supported_entities = self._get_entity_types()
-        return self._supported_entities
\ No newline at end of file
+            return self._supported_entities
\ No newline at end of file
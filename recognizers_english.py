@@ -4,14 +4,80 @@ Extends BaseRecognizer for English-specific PII detection.
 """
 
 from typing import List
-from presidio_analyzer import PatternRecognizer, Pattern
 
-from recognizers_base import BaseRecognizer
+from presidio_analyzer import PatternRecognizer
+
+from recognizers_base import (
+    BaseRecognizer,
+    FastPatternRecognizer,
+    KeywordGatedRecognizer,
+    PrecompiledPattern,
+)
 
 
 class EnglishRecognizers(BaseRecognizer):
     """English recognizers with all original patterns"""
     
+    __slots__ = ()
+    
+    # Patterns are built once at import; each recognizer gets a list of
+    # references to them instead of constructing fresh Pattern objects
+    _CRYPTO_WALLET_PATTERNS = (
+        PrecompiledPattern(
+            name="bitcoin_address",
+            regex=r"\b(?:[13][a-km-zA-HJ-NP-Z1-9]{25,34}|bc1[a-z0-9]{39,59})\b",
+            score=0.8
+        ),
+        PrecompiledPattern(
+            name="ethereum_address",
+            regex=r"\b0x[a-fA-F0-9]{40}\b",
+            score=0.8
+        ),
+    )
+    
+    _MEDICAL_LICENSE_PATTERNS = (
+        PrecompiledPattern(
+            name="medical_license",
+            regex=r"\b(?>MD|DO|NP|PA|RN|LPN|DDS|DMD|PharmD)[\s-]?+\d{6,10}+\b",
+            score=0.7
+        ),
+        PrecompiledPattern(
+            name="dea_number",
+            regex=r"\b[A-Z]{2}\d{7}\b",
+            score=0.8
+        ),
+    )
+    
+    _PROFESSIONAL_LICENSE_PATTERNS = (
+        # Atomic groups commit to the first matching prefix, so LICENSE
+        # must come before LIC
+        PrecompiledPattern(
+            name="generic_license",
+            regex=r"\b(?>LICENSE|LIC|PERMIT)[\s-]?+\d{6,12}+\b",
+            score=0.6
+        ),
+        PrecompiledPattern(
+            name="professional_license",
+            regex=r"\b(?>CPA|PE|ESQ|JD|MD|PhD|DDS)[\s-]?+\d{4,10}+\b",
+            score=0.7
+        ),
+    )
+    
+    # One alternation over all indicator keywords scans the text once
+    # instead of once per indicator group
+    _NRP_PATTERNS = (
+        PrecompiledPattern(
+            name="nrp_indicator",
+            regex=(
+                r"\b(?:nationality|citizen(?:ship)?|national(?:ity)?"
+                r"|religion|religious|faith|belief"
+                r"|political|party|affiliation)"
+                r"[\s:]*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b"
+            ),
+            score=0.6
+        ),
+    )
+    
     def _create_recognizers(self) -> List[PatternRecognizer]:
         """Create all English recognizers with full regex patterns"""
         return [
@@ -26,85 +92,35 @@ class EnglishRecognizers(BaseRecognizer):
     
     def _create_crypto_wallet_recognizer(self) -> PatternRecognizer:
         """Cryptocurrency wallet addresses - keeping original patterns"""
-        patterns = [
-            Pattern(
-                name="bitcoin_address",
-                regex=r"\b(?:[13][a-km-zA-HJ-NP-Z1-9]{25,34}|bc1[a-z0-9]{39,59})\b",
-                score=0.8
-            ),
-            Pattern(
-                name="ethereum_address",
-                regex=r"\b0x[a-fA-F0-9]{40}\b",
-                score=0.8
-            )
-        ]
-        return PatternRecognizer(
+        return FastPatternRecognizer(
             supported_entity="CRYPTO_WALLET",
-            patterns=patterns,
+            patterns=list(self._CRYPTO_WALLET_PATTERNS),
             supported_language="en"
         )
     
     def _create_medical_license_recognizer(self) -> PatternRecognizer:
         """Medical license numbers - keeping original patterns"""
-        patterns = [
-            Pattern(
-                name="medical_license",
-                regex=r"\b(?:MD|DO|NP|PA|RN|LPN|DDS|DMD|PharmD)[\s-]?\d{6,10}\b",
-                score=0.7
-            ),
-            Pattern(
-                name="dea_number",
-                regex=r"\b[A-Z]{2}\d{7}\b",
-                score=0.8
-            )
-        ]
-        return PatternRecognizer(
+        return FastPatternRecognizer(
             supported_entity="MEDICAL_LICENSE",
-            patterns=patterns,
+            patterns=list(self._MEDICAL_LICENSE_PATTERNS),
             supported_language="en"
         )
     
     def _create_enhanced_license_recognizer(self) -> PatternRecognizer:
         """Various license types - keeping original patterns"""
-        patterns = [
-            Pattern(
-                name="generic_license",
-                regex=r"\b(?:LIC|LICENSE|PERMIT)[\s-]?\d{6,12}\b",
-                score=0.6
-            ),
-            Pattern(
-                name="professional_license",
-                regex=r"\b(?:CPA|PE|ESQ|JD|MD|PhD|DDS)[\s-]?\d{4,10}\b",
-                score=0.7
-            )
-        ]
-        return PatternRecognizer(
+        return FastPatternRecognizer(
             supported_entity="PROFESSIONAL_LICENSE",
-            patterns=patterns,
+            patterns=list(self._PROFESSIONAL_LICENSE_PATTERNS),
             supported_language="en"
         )
     
     def _create_nrp_recognizer(self) -> PatternRecognizer:
         """Nationality, Religious, Political group indicators - keeping original patterns"""
-        patterns = [
-            Pattern(
-                name="nationality_indicator",
-                regex=r"\b(?:nationality|citizen(?:ship)?|national(?:ity)?)[\s:]*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b",
-                score=0.6
-            ),
-            Pattern(
-                name="religion_indicator",
-                regex=r"\b(?:religion|religious|faith|belief)[\s:]*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b",
-                score=0.6
-            ),
-            Pattern(
-                name="political_indicator",
-                regex=r"\b(?:political|party|affiliation)[\s:]*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b",
-                score=0.6
-            )
-        ]
-        return PatternRecognizer(
+        # Shortest stems of the keywords that open the pattern
+        return KeywordGatedRecognizer(
+            keywords=("citizen", "national", "religio", "faith", "belief",
+                      "political", "party", "affiliation"),
             supported_entity="NRP",
-            patterns=patterns,
-            supported_language="de"
+            patterns=list(self._NRP_PATTERNS),
+            supported_language="en"
         )
\ No newline at end of file
@@ -3,8 +3,8 @@ Factory pattern for creating recognizers based on language.
 Implements the Factory pattern with singleton-like caching.
 """
 
-import weakref
-from typing import List
+import threading
+from typing import Dict, FrozenSet, List, Tuple
 
 from core import Language
 from exceptions import ConfigurationError
@@ -12,36 +12,75 @@ from recognizers_base import BaseRecognizer
 from recognizers_english import EnglishRecognizers
 from recognizers_german import GermanRecognizers
 
+# Entities handled by presidio's built-in recognizers for every language
+_BASE_ENTITIES = (
+    "CREDIT_CARD", "DATE_TIME", "EMAIL_ADDRESS", "IBAN_CODE",
+    "IP_ADDRESS", "LOCATION", "PERSON", "PHONE_NUMBER", "URL"
+)
+
 
 class RecognizerFactory:
-    """Factory for creating recognizers (Factory Pattern)"""
+    """Factory for creating recognizers (Factory Pattern).
+    
+    One recognizer set is built per language and process and shared by
+    every analyzer. It is safe to use from concurrent threads: patterns
+    are immutable class-level tuples, recognizers hold no per-text state,
+    and each analyze call keeps its own scan results.
+    """
     
     _recognizer_classes = {
         Language.ENGLISH: EnglishRecognizers,
         Language.GERMAN: GermanRecognizers
     }
     
-    _instances = weakref.WeakValueDictionary()
+    _instances: Dict[Language, BaseRecognizer] = {}
+    _instances_lock = threading.Lock()
     
     @classmethod
     def create_recognizer(cls, language: Language) -> BaseRecognizer:
         """Create or reuse recognizer instance"""
-        if language in cls._instances:
-            return cls._instances[language]
+        recognizer = cls._instances.get(language)
+        if recognizer is not None:
+            return recognizer
         
         if language not in cls._recognizer_classes:
             raise ConfigurationError(f"Unsupported language: {language}")
         
-        recognizer = cls._recognizer_classes[language]()
-        cls._instances[language] = recognizer
+        # Double-checked so concurrent first calls build only one recognizer
+        with cls._instances_lock:
+            recognizer = cls._instances.get(language)
+            if recognizer is None:
+                recognizer = cls._recognizer_classes[language]()
+                cls._instances[language] = recognizer
         return recognizer
     
     @classmethod
     def get_all_supported_entities(cls, language: Language) -> List[str]:
-        """Get all supported entities for a language"""
-        base_entities = [
-            "CREDIT_CARD", "DATE_TIME", "EMAIL_ADDRESS", "IBAN_CODE",
-            "IP_ADDRESS", "LOCATION", "PERSON", "PHONE_NUMBER", "URL"
-        ]
-        recognizer = cls.create_recognizer(language)
-        return base_entities + recognizer.get_supported_entities()
\ No newline at end of file
+        """Get all supported entities for a language.
+        
+        The result never changes for a language, so callers may cache it.
+        """
+        entities = _SUPPORTED_ENTITIES.get(language)
+        if entities is None:
+            raise ConfigurationError(f"Unsupported language: {language}")
+        # Hand out a copy so callers cannot alter the shared entities
+        return list(entities)
+    
+    @classmethod
+    def get_supported_entities_set(cls, language: Language) -> FrozenSet[str]:
+        """Get supported entities as a shared frozenset for membership checks"""
+        entities = _SUPPORTED_ENTITY_SETS.get(language)
+        if entities is None:
+            raise ConfigurationError(f"Unsupported language: {language}")
+        return entities
+
+
+# Supported entities never change, so materialize them once at import; entity
+# types come from the recognizer classes without building their patterns
+_SUPPORTED_ENTITIES: Dict[Language, Tuple[str, ...]] = {
+    language: _BASE_ENTITIES + tuple(recognizer_class().get_supported_entities())
+    for language, recognizer_class in RecognizerFactory._recognizer_classes.items()
+}
+_SUPPORTED_ENTITY_SETS: Dict[Language, FrozenSet[str]] = {
+    language: frozenset(entities) for language, entities in _SUPPORTED_ENTITIES.items()
+}
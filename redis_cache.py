@@ -3,12 +3,102 @@ Redis caching strategy for the PII anonymizer module.
 Implements the Strategy pattern for Redis-based caching.
 """
 
+import hashlib
 import json
+import logging
 import os
-from typing import Optional, Any
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, Optional
 import redis
+from cache import NoCacheStrategy, ThreadSafeLRUCache
 from interfaces import ICacheStrategy
 
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    # Dataclasses and datetimes are left unserializable, as with stdlib json
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+    
+    def _dumps(value: Any) -> bytes:
+        """Serialize straight to the bytes Redis stores"""
+        return orjson.dumps(value, option=_ORJSON_OPTIONS)
+    
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Serialized values at least this large are stored zlib-compressed behind a
+# marker byte that no JSON document starts with; smaller ones are stored as is
+_COMPRESS_MIN_SIZE = 1024
+_COMPRESSED_MARKER = b"\x01"
+
+# Keys longer than this are stored under a fixed-size digest
+_MAX_PLAIN_KEY_LENGTH = 64
+
+# Consecutive Redis failures that open the circuit, and seconds it stays open
+_BREAKER_FAIL_MAX = 5
+_BREAKER_RESET_TIMEOUT = 30.0
+
+# Keys requested per SCAN call when clearing
+_CLEAR_SCAN_COUNT = 1000
+# Queued UNLINK batches sent per pipeline flush when clearing
+_CLEAR_PIPELINE_BATCHES = 10
+
+
+def _encode(value: Any):
+    """Serialize a value for Redis, compressing large payloads"""
+    serialized = _dumps(value)
+    if len(serialized) < _COMPRESS_MIN_SIZE:
+        return serialized
+    if isinstance(serialized, str):
+        serialized = serialized.encode()
+    return _COMPRESSED_MARKER + zlib.compress(serialized, 1)
+
+
+def _decode(serialized: bytes) -> Any:
+    """Inverse of _encode; also reads uncompressed values"""
+    if serialized[:1] == _COMPRESSED_MARKER:
+        serialized = zlib.decompress(serialized[1:])
+    return _loads(serialized)
+
+
+class _CircuitBreaker:
+    """Stops calling Redis for a while after consecutive failures"""
+    
+    def __init__(self, fail_max: int, reset_timeout: float):
+        self._fail_max = fail_max
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+    
+    @property
+    def closed(self) -> bool:
+        return time.monotonic() >= self._open_until
+    
+    def record_success(self) -> None:
+        self._failures = 0
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self._fail_max:
+                self._open_until = time.monotonic() + self._reset_timeout
+                # After the timeout one more failure reopens the circuit
+                self._failures = self._fail_max - 1
+
 
 class RedisCache(ICacheStrategy):
     """Redis cache implementation for distributed caching"""
@@ -20,7 +110,11 @@ class RedisCache(ICacheStrategy):
         db: int = None, 
         password: Optional[str] = None,
         key_prefix: str = None,
-        expiration_time: int = None
+        expiration_time: int = None,
+        local_maxsize: int = None,
+        local_ttl: float = None,
+        unix_socket_path: Optional[str] = None,
+        max_connections: int = None
     ):
         """
         Initialize Redis cache
@@ -32,59 +126,190 @@ class RedisCache(ICacheStrategy):
             password: Redis password (if required)
             key_prefix: Prefix for all keys stored in Redis
             expiration_time: Time in seconds before keys expire (0 for no expiration)
+            local_maxsize: Entries kept in process in front of Redis (0 to disable)
+            local_ttl: Seconds a local entry is served before Redis is asked again
+            unix_socket_path: Connect through this UNIX socket instead of host/port
+            max_connections: Upper bound on pooled connections (unbounded if unset)
         """
         # Get configuration from environment variables with fallbacks
-        self._redis = redis.Redis(
-            host=host or os.environ.get('REDIS_HOST', 'localhost'),
-            port=int(port or os.environ.get('REDIS_PORT', 6379)),
-            db=int(db or os.environ.get('REDIS_DB', 0)),
-            password=password or os.environ.get('REDIS_PASSWORD', None),
-            decode_responses=False  
-        )
+        max_connections = max_connections or os.environ.get('REDIS_POOL_SIZE')
+        unix_socket_path = unix_socket_path or os.environ.get('REDIS_UNIX_SOCKET')
+        socket_timeout = float(os.environ.get('REDIS_SOCKET_TIMEOUT', 1.0))
+        connection_kwargs = {
+            'db': int(db or os.environ.get('REDIS_DB', 0)),
+            'password': password or os.environ.get('REDIS_PASSWORD', None),
+            'socket_connect_timeout': socket_timeout,
+            'socket_timeout': socket_timeout,
+            'decode_responses': False,
+        }
+        # A local Redis can skip TCP by listening on a UNIX socket
+        if unix_socket_path:
+            connection_kwargs['connection_class'] = redis.UnixDomainSocketConnection
+            connection_kwargs['path'] = unix_socket_path
+        else:
+            connection_kwargs['host'] = host or os.environ.get('REDIS_HOST', 'localhost')
+            connection_kwargs['port'] = int(port or os.environ.get('REDIS_PORT', 6379))
+        # Threads share the pool. A bounded pool makes callers wait for a free
+        # connection; the default pool would raise, which counts as a failure
+        if max_connections:
+            pool = redis.BlockingConnectionPool(
+                max_connections=int(max_connections),
+                timeout=socket_timeout,
+                **connection_kwargs
+            )
+        else:
+            pool = redis.ConnectionPool(**connection_kwargs)
+        self._redis = redis.Redis(connection_pool=pool)
+        # A failing Redis turns lookups into misses instead of stalling requests
+        self._breaker = _CircuitBreaker(_BREAKER_FAIL_MAX, _BREAKER_RESET_TIMEOUT)
         self._key_prefix = key_prefix or os.environ.get('REDIS_KEY_PREFIX', 'pii_anonymizer:')
         self._expiration_time = int(expiration_time or os.environ.get('REDIS_EXPIRATION_TIME', 3600))
+        # Hot keys are served from process memory without a Redis round trip.
+        # Other processes may overwrite or clear a key in Redis, so a local
+        # entry is only trusted for a short while, never past the Redis TTL
+        if local_maxsize is None:
+            local_maxsize = int(os.environ.get('REDIS_LOCAL_CACHE_SIZE', 4096))
+        if local_ttl is None:
+            local_ttl = float(os.environ.get('REDIS_LOCAL_CACHE_TTL', 60))
+        if self._expiration_time > 0:
+            local_ttl = min(local_ttl, self._expiration_time)
+        self._local_ttl = local_ttl
+        self._local = ThreadSafeLRUCache(local_maxsize) if local_maxsize > 0 else NoCacheStrategy()
     
     def _format_key(self, key: str) -> str:
-        """Format key with prefix"""
+        """Format key with prefix, hashing long keys to a fixed size"""
+        if len(key) > _MAX_PLAIN_KEY_LENGTH:
+            key = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
         return f"{self._key_prefix}{key}"
     
+    def _local_get(self, key: str) -> Optional[Any]:
+        """Value cached in process, unless its entry has expired"""
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            return None
+        return value
+    
+    def _local_set(self, key: str, value: Any) -> None:
+        """Cache a value in process until the local TTL runs out"""
+        self._local.set(key, (value, time.monotonic() + self._local_ttl))
+    
+    def _call(self, command, *args, default=None):
+        """Run a Redis command unless the circuit is open; default on failure"""
+        if not self._breaker.closed:
+            return default
+        try:
+            result = command(*args)
+        except redis.RedisError:
+            self._breaker.record_failure()
+            logger.warning("Redis command failed, treating it as a cache miss", exc_info=True)
+            return default
+        self._breaker.record_success()
+        return result
+    
     def get(self, key: str) -> Optional[Any]:
-        """Get value from Redis cache"""
+        """Get value from the local cache, then Redis"""
+        value = self._local_get(key)
+        if value is not None:
+            return value
+        
         formatted_key = self._format_key(key)
-        value = self._redis.get(formatted_key)
+        value = self._call(self._redis.get, formatted_key)
         
         if value is None:
             return None
         
         try:
-            return json.loads(value)
-        except (json.JSONDecodeError, TypeError):
+            value = _decode(value)
+        except (json.JSONDecodeError, TypeError, zlib.error):
             return None
+        self._local_set(key, value)
+        return value
+    
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several values, fetching local misses with a single MGET"""
+        values = [self._local_get(key) for key in keys]
+        missing = [index for index, value in enumerate(values) if value is None]
+        if not missing:
+            return values
+        
+        serialized_values = self._call(
+            self._redis.mget,
+            [self._format_key(keys[index]) for index in missing],
+            default=[None] * len(missing)
+        )
+        for index, serialized in zip(missing, serialized_values):
+            if serialized is None:
+                continue
+            try:
+                value = _decode(serialized)
+            except (json.JSONDecodeError, TypeError, zlib.error):
+                continue
+            self._local_set(keys[index], value)
+            values[index] = value
+        return values
     
     def set(self, key: str, value: Any) -> None:
         """Set value in Redis cache with expiration"""
         formatted_key = self._format_key(key)
         
         try:
-            serialized_value = json.dumps(value)
+            serialized_value = _encode(value)
+        except (TypeError, ValueError):
+            return
+        if self._expiration_time > 0:
+            self._call(
+                self._redis.setex,
+                formatted_key, 
+                self._expiration_time, 
+                serialized_value
+            )
+        else:
+            self._call(self._redis.set, formatted_key, serialized_value)
+        # Cache what a Redis hit would return, not the caller's object
+        self._local_set(key, _decode(serialized_value))
+    
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """Set several values in one pipelined round trip"""
+        pipe = self._redis.pipeline(transaction=False)
+        stored = []
+        for key, value in items.items():
+            try:
+                serialized_value = _encode(value)
+            except (TypeError, ValueError):
+                continue
+            formatted_key = self._format_key(key)
             if self._expiration_time > 0:
-                self._redis.setex(
-                    formatted_key, 
-                    self._expiration_time, 
-                    serialized_value
-                )
+                pipe.setex(formatted_key, self._expiration_time, serialized_value)
             else:
-                self._redis.set(formatted_key, serialized_value)
-        except (TypeError, ValueError):
-            pass
+                pipe.set(formatted_key, serialized_value)
+            stored.append((key, serialized_value))
+        if not stored:
+            return
+        self._call(pipe.execute)
+        for key, serialized_value in stored:
+            self._local_set(key, _decode(serialized_value))
     
     def clear(self) -> None:
         """Clear all keys with this prefix"""
+        self._local.clear()
+        self._call(self._clear_redis)
+    
+    def _clear_redis(self) -> None:
+        """Unlink every Redis key with this prefix"""
         pattern = f"{self._key_prefix}*"
+        # Deletes ride along in a pipeline instead of a round trip per batch;
+        # UNLINK frees the values in the background on the server
+        pipe = self._redis.pipeline(transaction=False)
         cursor = 0
         while True:
-            cursor, keys = self._redis.scan(cursor, pattern, 100)
+            cursor, keys = self._redis.scan(cursor, pattern, _CLEAR_SCAN_COUNT)
             if keys:
-                self._redis.delete(*keys)
+                pipe.unlink(*keys)
+                if len(pipe) >= _CLEAR_PIPELINE_BATCHES:
+                    pipe.execute()
             if cursor == 0:
-                break
\ No newline at end of file
+                break
+        pipe.execute()
\ No newline at end of file
@@ -3,6 +3,7 @@ from unittest.mock import patch, MagicMock, AsyncMock
 import sys
 import os
 import asyncio
+import subprocess
 
 # Add parent directory to path to import modules directly
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -53,6 +54,20 @@ class TestAsyncPIIAnalyzerEngine(unittest.TestCase):
         self.assertEqual(call_kwargs.get('nlp_engine'), mock_nlp_engine)
         self.assertEqual(call_kwargs.get('registry'), mock_registry_instance)
         self.assertEqual(analyzer, mock_analyzer_instance)
+        
+        # Verify unused spaCy components are disabled in the NLP config
+        nlp_config = mock_nlp_provider.call_args[1]['nlp_configuration']
+        self.assertIn("parser", nlp_config["models"][0]["disable"])
+    
+    @patch('analyzer.AsyncPIIAnalyzerEngine._create_analyzer')
+    def test_analyzer_shared_across_engines(self, mock_create_analyzer):
+        """Test that loaded analyzers are reused by new engine instances"""
+        with patch.dict('analyzer._analyzer_pool', clear=True):
+            first = self.analyzer._get_or_create_analyzer(Language.GERMAN)
+            second = AsyncPIIAnalyzerEngine()._get_or_create_analyzer(Language.GERMAN)
+        
+        self.assertIs(first, second)
+        mock_create_analyzer.assert_called_once_with(Language.GERMAN)
     
     def test_get_cache_key(self):
         """Test cache key generation"""
@@ -75,7 +90,11 @@ class TestAsyncPIIAnalyzerEngine(unittest.TestCase):
         self.assertNotEqual(key, different_text_key)
         self.assertNotEqual(key, different_lang_key)
         self.assertNotEqual(key, different_entities_key)
-    
+
+        # Entity order and container type should not affect the key
+        reordered_key = self.analyzer._get_cache_key(text, language, ("LOCATION", "PERSON"))
+        self.assertEqual(key, reordered_key)
+
     @patch('analyzer.AsyncPIIAnalyzerEngine._get_or_create_analyzer')
     async def test_analyze_async_with_cache_hit(self, mock_get_analyzer):
         """Test analyze_async with cache hit"""
@@ -126,6 +145,148 @@ class TestAsyncPIIAnalyzerEngine(unittest.TestCase):
             cached_result = self.cache.get(cache_key)
             self.assertEqual(cached_result, expected_result)
     
+    @patch('analyzer.AsyncPIIAnalyzerEngine._get_cache_key')
+    @patch('analyzer.AsyncPIIAnalyzerEngine._analyze_sync_internal')
+    async def test_analyze_async_without_cache(self, mock_analyze_internal, mock_get_cache_key):
+        """Test that no cache key is computed when caching is disabled"""
+        mock_analyze_internal.return_value = []
+        analyzer = AsyncPIIAnalyzerEngine(cache_strategy=NoCacheStrategy())
+        
+        async with analyzer:
+            result = await analyzer.analyze_async("John Smith", Language.ENGLISH, ["PERSON"])
+        
+        self.assertEqual(result, [])
+        mock_get_cache_key.assert_not_called()
+    
+    @patch('analyzer.AsyncPIIAnalyzerEngine._analyze_batch_sync_internal')
+    async def test_analyze_batch_async(self, mock_analyze_batch):
+        """Test analyze_batch_async only sends cache misses to the batch"""
+        language = Language.ENGLISH
+        entities = ["PERSON"]
+        cached_result = [
+            EntityMatch(entity_type="PERSON", start=0, end=4, text="John", confidence=0.9)
+        ]
+        fresh_result = [
+            EntityMatch(entity_type="PERSON", start=0, end=4, text="Jane", confidence=0.8)
+        ]
+        self.cache.set(self.analyzer._get_cache_key("John", language, entities), cached_result)
+        mock_analyze_batch.return_value = [fresh_result]
+        
+        async with self.analyzer:
+            results = await self.analyzer.analyze_batch_async(["John", "Jane"], language, entities)
+        
+        self.assertEqual(results, [cached_result, fresh_result])
+        mock_analyze_batch.assert_called_once_with(["Jane"], language, entities)
+        self.assertEqual(
+            self.cache.get(self.analyzer._get_cache_key("Jane", language, entities)),
+            fresh_result
+        )
+    
+    @patch('analyzer.AsyncPIIAnalyzerEngine._analyze_batch_sync_internal')
+    async def test_analyze_batch_async_batched_cache(self, mock_analyze_batch):
+        """Test that caches with get_many/set_many are queried once per batch"""
+        language = Language.ENGLISH
+        entities = ["PERSON"]
+        cached_result = [
+            EntityMatch(entity_type="PERSON", start=0, end=4, text="John", confidence=0.9)
+        ]
+        fresh_result = []
+        cache = MagicMock()
+        cache.get_many.return_value = [cached_result, None]
+        mock_analyze_batch.return_value = [fresh_result]
+        analyzer = AsyncPIIAnalyzerEngine(cache_strategy=cache)
+        
+        async with analyzer:
+            results = await analyzer.analyze_batch_async(["John", "Jane"], language, entities)
+        
+        self.assertEqual(results, [cached_result, fresh_result])
+        cache.get_many.assert_called_once_with([
+            analyzer._get_cache_key("John", language, entities),
+            analyzer._get_cache_key("Jane", language, entities),
+        ])
+        cache.set_many.assert_called_once_with(
+            {analyzer._get_cache_key("Jane", language, entities): fresh_result}
+        )
+        cache.get.assert_not_called()
+        cache.set.assert_not_called()
+    
+    @patch('analyzer.ProcessPoolExecutor')
+    async def test_process_pool_executor(self, mock_process_pool):
+        """Test that use_processes shares one long-lived process pool"""
+        with patch.dict('analyzer._process_pools', clear=True):
+            first = AsyncPIIAnalyzerEngine(
+                cache_strategy=self.cache, max_workers=2, use_processes=True, language=Language.GERMAN
+            )
+            async with first:
+                self.assertIs(first._executor, mock_process_pool.return_value)
+            second = AsyncPIIAnalyzerEngine(
+                cache_strategy=self.cache, max_workers=2, use_processes=True, language=Language.GERMAN
+            )
+            async with second:
+                self.assertIs(second._executor, mock_process_pool.return_value)
+        
+        mock_process_pool.assert_called_once()
+        call_kwargs = mock_process_pool.call_args[1]
+        self.assertEqual(call_kwargs['max_workers'], 2)
+        self.assertIsNotNone(call_kwargs['initializer'])
+        self.assertEqual(call_kwargs['initargs'], ("de",))
+        mock_process_pool.return_value.shutdown.assert_not_called()
+    
+    @patch('analyzer._pin_threads')
+    @patch('analyzer.AsyncPIIAnalyzerEngine._get_or_create_analyzer')
+    def test_worker_initializer_preloads_analyzer(self, mock_get_analyzer, mock_pin_threads):
+        """Test that pool workers pin threads and load the configured language's analyzer"""
+        import analyzer as analyzer_module
+        with patch.object(analyzer_module, '_worker_engine', None):
+            analyzer_module._init_worker_engine("de")
+            self.assertIsNotNone(analyzer_module._worker_engine)
+        mock_pin_threads.assert_called_once()
+        mock_get_analyzer.assert_called_once_with(Language.GERMAN)
+    
+    def test_import_leaves_thread_settings_alone(self):
+        """Test that importing the analyzer does not change the environment"""
+        env = {
+            name: value for name, value in os.environ.items()
+            if name not in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS')
+        }
+        code = (
+            "import os, analyzer; "
+            "print(any(name in os.environ for name in "
+            "('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS')))"
+        )
+        output = subprocess.check_output([sys.executable, "-c", code], cwd=parent_dir, env=env)
+        
+        self.assertEqual(output.decode().strip(), "False")
+    
+    def test_pin_threads_limits_torch_once(self):
+        """Test that torch is pinned to one thread once, leaving the environment alone"""
+        import analyzer as analyzer_module
+        torch = MagicMock()
+        environ = dict(os.environ)
+        with patch.object(analyzer_module, '_threads_pinned', False), \
+                patch.dict(sys.modules, {'torch': torch}):
+            analyzer_module._pin_threads()
+            analyzer_module._pin_threads()
+        
+        torch.set_num_threads.assert_called_once_with(1)
+        self.assertEqual(dict(os.environ), environ)
+    
+    def test_to_entity_matches(self):
+        """Test conversion of presidio results into EntityMatch objects"""
+        from presidio_analyzer import RecognizerResult
+        text = "John Smith lives in New York"
+        results = [
+            RecognizerResult(entity_type="PERSON", start=0, end=10, score=0.85),
+            RecognizerResult(entity_type="LOCATION", start=20, end=28, score=0.7)
+        ]
+        
+        matches = AsyncPIIAnalyzerEngine._to_entity_matches(text, results)
+        
+        self.assertEqual(matches, [
+            EntityMatch(entity_type="PERSON", start=0, end=10, text="John Smith", confidence=0.85),
+            EntityMatch(entity_type="LOCATION", start=20, end=28, text="New York", confidence=0.7)
+        ])
+    
     def test_analyze_sync_internal(self):
         """Test the internal synchronous analysis method"""
         # This would require more extensive mocking of the presidio analyzer
@@ -161,6 +322,10 @@ def async_test(async_func):
 # Apply the decorator to the async test methods
 TestAsyncPIIAnalyzerEngine.test_analyze_async_with_cache_hit = async_test(TestAsyncPIIAnalyzerEngine.test_analyze_async_with_cache_hit)
 TestAsyncPIIAnalyzerEngine.test_analyze_async_with_cache_miss = async_test(TestAsyncPIIAnalyzerEngine.test_analyze_async_with_cache_miss)
+TestAsyncPIIAnalyzerEngine.test_analyze_async_without_cache = async_test(TestAsyncPIIAnalyzerEngine.test_analyze_async_without_cache)
+TestAsyncPIIAnalyzerEngine.test_analyze_batch_async = async_test(TestAsyncPIIAnalyzerEngine.test_analyze_batch_async)
+TestAsyncPIIAnalyzerEngine.test_analyze_batch_async_batched_cache = async_test(TestAsyncPIIAnalyzerEngine.test_analyze_batch_async_batched_cache)
+TestAsyncPIIAnalyzerEngine.test_process_pool_executor = async_test(TestAsyncPIIAnalyzerEngine.test_process_pool_executor)
 
 
 if __name__ == "__main__":
@@ -9,7 +9,16 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
-from cache import ThreadSafeLRUCache, NoCacheStrategy
+from cache import (
+    ThreadSafeLRUCache,
+    ThreadSafePolicyCache,
+    NoCacheStrategy,
+    LRUPolicy,
+    TinyLFUPolicy,
+    TwoRandomPolicy,
+    create_cache_strategy,
+)
+from exceptions import ConfigurationError
 
 
 class TestThreadSafeLRUCache(unittest.TestCase):
@@ -59,6 +68,22 @@ class TestThreadSafeLRUCache(unittest.TestCase):
         self.assertEqual(self.cache.get("key3"), "value3")
         self.assertEqual(self.cache.get("key4"), "value4")
     
+    def test_update_at_capacity_does_not_evict(self):
+        """Test that updating an existing key at capacity keeps all entries"""
+        self.cache.set("key1", "value1")
+        self.cache.set("key2", "value2")
+        self.cache.set("key3", "value3")
+
+        # Updating key1 should refresh it rather than evict anything
+        self.cache.set("key1", "new_value1")
+        self.assertEqual(self.cache.get("key1"), "new_value1")
+        self.assertEqual(self.cache.get("key2"), "value2")
+        self.assertEqual(self.cache.get("key3"), "value3")
+
+        # key1 was refreshed and then key2/key3 read, so key1 is now LRU
+        self.cache.set("key4", "value4")
+        self.assertIsNone(self.cache.get("key1"))
+
     def test_clear(self):
         """Test clearing the cache"""
         # Add some items
@@ -112,6 +137,65 @@ class TestThreadSafeLRUCache(unittest.TestCase):
             # So we don't assert on specific values
 
 
+class TestThreadSafePolicyCache(unittest.TestCase):
+    """Test the ThreadSafePolicyCache class with each eviction policy"""
+    
+    def test_lru_policy_eviction(self):
+        """Test that the LRU policy matches ThreadSafeLRUCache behavior"""
+        cache = ThreadSafePolicyCache(maxsize=2, policy=LRUPolicy())
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        cache.get("key1")
+        cache.set("key3", "value3")
+        
+        self.assertIsNone(cache.get("key2"))
+        self.assertEqual(cache.get("key1"), "value1")
+        self.assertEqual(cache.get("key3"), "value3")
+    
+    def test_tinylfu_keeps_frequent_entries(self):
+        """Test that TinyLFU rejects one-off keys in favor of hot ones"""
+        cache = ThreadSafePolicyCache(maxsize=2, policy=TinyLFUPolicy(2))
+        cache.set("hot1", "value1")
+        cache.set("hot2", "value2")
+        for _ in range(5):
+            cache.get("hot1")
+            cache.get("hot2")
+        
+        # A key seen once should not displace frequently read keys
+        cache.get("one_off")
+        cache.set("one_off", "value")
+        self.assertIsNone(cache.get("one_off"))
+        self.assertEqual(cache.get("hot1"), "value1")
+        self.assertEqual(cache.get("hot2"), "value2")
+    
+    def test_two_random_respects_maxsize(self):
+        """Test that 2-random eviction keeps the cache bounded"""
+        cache = ThreadSafePolicyCache(maxsize=5, policy=TwoRandomPolicy())
+        for i in range(50):
+            cache.set(f"key{i}", i)
+        
+        present = [i for i in range(50) if cache.get(f"key{i}") is not None]
+        self.assertEqual(len(present), 5)
+        self.assertIn(49, present)
+    
+    def test_clear(self):
+        """Test clearing a policy cache"""
+        cache = ThreadSafePolicyCache(maxsize=2, policy=TwoRandomPolicy())
+        cache.set("key1", "value1")
+        cache.clear()
+        self.assertIsNone(cache.get("key1"))
+        cache.set("key2", "value2")
+        self.assertEqual(cache.get("key2"), "value2")
+    
+    def test_create_cache_strategy(self):
+        """Test building caches by policy name"""
+        self.assertIsInstance(create_cache_strategy("lru"), ThreadSafeLRUCache)
+        self.assertIsInstance(create_cache_strategy("tinylfu"), ThreadSafePolicyCache)
+        self.assertIsInstance(create_cache_strategy("two_random"), ThreadSafePolicyCache)
+        with self.assertRaises(ConfigurationError):
+            create_cache_strategy("unknown")
+
+
 class TestNoCacheStrategy(unittest.TestCase):
     """Test the NoCacheStrategy class"""
     
@@ -79,6 +79,22 @@ class TestEntityMatch(unittest.TestCase):
                 confidence=-0.1  # Negative confidence
             )
     
+    def test_from_presidio(self):
+        """Test the trusted constructor matches the validated one"""
+        trusted = EntityMatch._from_presidio("PERSON", 0, 10, "John Smith", 0.8)
+        validated = EntityMatch(
+            entity_type="PERSON",
+            start=0,
+            end=10,
+            text="John Smith",
+            confidence=0.8
+        )
+        
+        self.assertEqual(trusted, validated)
+        self.assertEqual(hash(trusted), hash(validated))
+        with self.assertRaises(AttributeError):
+            trusted.start = 5
+    
     def test_to_dict(self):
         """Test to_dict method"""
         entity = EntityMatch(
@@ -171,6 +187,8 @@ class TestProcessingConfig(unittest.TestCase):
         self.assertEqual(config.max_workers, 4)
         self.assertEqual(config.chunk_size, 2000)
         self.assertTrue(config.cache_enabled)
+        self.assertEqual(config.cache_policy, "lru")
+        self.assertFalse(config.use_process_pool)
     
     def test_custom_config(self):
         """Test custom configuration"""
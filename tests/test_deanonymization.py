@@ -0,0 +1,77 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import modules directly
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from deanonymization import DeanonymizationService
+from core import AnonymizedEntity
+
+
+class TestDeanonymizationService(unittest.TestCase):
+    """Test the DeanonymizationService class"""
+    
+    def test_deanonymize_with_entity_objects(self):
+        """Test restoring values from AnonymizedEntity objects"""
+        entities_map = {
+            "PERSON_1": AnonymizedEntity(
+                entity_id="PERSON_1",
+                original_value="John Smith",
+                entity_type="PERSON",
+                fake_value="Jane Doe",
+                confidence=0.9
+            ),
+            "EMAIL_1": AnonymizedEntity(
+                entity_id="EMAIL_1",
+                original_value="john@example.com",
+                entity_type="EMAIL_ADDRESS",
+                fake_value="jane@example.org",
+                confidence=0.8
+            )
+        }
+        
+        result = DeanonymizationService.deanonymize_text(
+            "Jane Doe's email is jane@example.org", entities_map
+        )
+        
+        self.assertEqual(result.anonymized_data, "John Smith's email is john@example.com")
+        self.assertEqual(result.metadata["entities_processed"], 2)
+    
+    def test_deanonymize_with_dicts(self):
+        """Test restoring values from serialized entity dicts"""
+        entities_map = {
+            "PERSON_1": {"fake_value": "Jane Doe", "original_value": "John Smith"}
+        }
+        
+        result = DeanonymizationService.deanonymize_text("Hello Jane Doe", entities_map)
+        
+        self.assertEqual(result.anonymized_data, "Hello John Smith")
+    
+    def test_longest_fake_value_wins(self):
+        """Test that a fake value contained in a longer one is not partially replaced"""
+        entities_map = {
+            "FIRST_1": {"fake_value": "Jane", "original_value": "John"},
+            "PERSON_1": {"fake_value": "Jane Doe", "original_value": "John Smith"}
+        }
+        
+        result = DeanonymizationService.deanonymize_text("Jane Doe and Jane", entities_map)
+        
+        self.assertEqual(result.anonymized_data, "John Smith and John")
+    
+    def test_restored_values_are_not_replaced_again(self):
+        """Test that an original value containing another fake value is left intact"""
+        entities_map = {
+            "PERSON_1": {"fake_value": "Alice", "original_value": "Bob"},
+            "PERSON_2": {"fake_value": "Bob", "original_value": "Carol"}
+        }
+        
+        result = DeanonymizationService.deanonymize_text("Alice met Bob", entities_map)
+        
+        self.assertEqual(result.anonymized_data, "Bob met Carol")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -130,9 +130,11 @@ class TestArchitecturalPIIAnonymizer(unittest.TestCase):
         # Verify result
         self.assertEqual(result.anonymized_data, "John Smith")
     
+    @patch.dict(os.environ, {'CACHE_POLICY': 'tinylfu'})
+    @patch('facade.create_cache_strategy')
     @patch('facade.AsyncPIIAnalyzerEngine')
     @patch('facade.RecognizerFactory')
-    def test_analyze_only_async(self, mock_factory, mock_analyzer_class):
+    def test_analyze_only_async(self, mock_factory, mock_analyzer_class, mock_create_cache):
         """Test async analysis without anonymization"""
         # Set up mocks
         mock_factory.get_all_supported_entities.return_value = ["PERSON", "EMAIL_ADDRESS"]
@@ -159,8 +161,9 @@ class TestArchitecturalPIIAnonymizer(unittest.TestCase):
             confidence_threshold=0.7
         ))
         
-        # Verify analyzer was created
-        mock_analyzer_class.assert_called_once()
+        # Verify analyzer was created with the configured cache policy
+        mock_create_cache.assert_called_once_with("tinylfu")
+        mock_analyzer_class.assert_called_once_with(mock_create_cache.return_value)
         
         # Verify analyze_async was called
         mock_analyzer_instance.analyze_async.assert_called_once()
@@ -3,6 +3,7 @@ from unittest.mock import patch, MagicMock
 import sys
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
@@ -28,6 +29,11 @@ class TestFakeDataGenerator(unittest.TestCase):
         # Test German locale
         self.assertIn('de_DE', self.german_generator.fake.locales)
     
+    def test_faker_shared_per_locale(self):
+        """Test that generators for the same language share one Faker"""
+        self.assertIs(FakeDataGenerator(Language.GERMAN).fake, self.german_generator.fake)
+        self.assertIsNot(self.english_generator.fake, self.german_generator.fake)
+    
     def test_generate_entity_id(self):
         """Test entity ID generation"""
         entity_type = "PERSON"
@@ -52,6 +58,12 @@ class TestFakeDataGenerator(unittest.TestCase):
         
 
         self.assertTrue(re.match(r'^\[UNKNOWN_TYPE_[0-9a-f]{8}\]$', default_value))
+        
+        # Default values follow the seeded RNG like every other generator
+        self.assertEqual(
+            self.english_generator.generate_consistent_fake_value(entity_type, original_value),
+            self.english_generator.generate_consistent_fake_value(entity_type, original_value)
+        )
     
     def test_generate_fake_value_with_custom_generator(self):
         """Test fake value generation with custom generator"""
@@ -80,6 +92,33 @@ class TestFakeDataGenerator(unittest.TestCase):
         self.assertTrue(phone_value)
         self.assertNotEqual(phone_value, "123-456-7890")
     
+    def test_token_based_generators(self):
+        """Test generators that append random hex tokens"""
+        wallet = self.english_generator.generate_fake_value("CRYPTO_WALLET", "original")
+        group = self.english_generator.generate_fake_value("NRP", "original")
+        
+        self.assertTrue(re.match(r'^1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa[0-9a-f]{8}$', wallet))
+        self.assertTrue(re.match(r'^GROUP_[0-9a-f]{6}$', group))
+    
+    def test_german_number_formats(self):
+        """Test the formats of template-based German generators"""
+        expected_formats = {
+            "DE_PENSION_INSURANCE": r'^\d{8}A\d{3}$',
+            "DE_HEALTH_INSURANCE": r'^A\d{10}$',
+            "DE_VAT_ID": r'^DE\d{9}$',
+            "DE_COMPANY_TAX": r'^\d{1,3}/\d{1,3}/\d{1,5}$',
+            "DE_COMMERCIAL_REGISTER": r'^HR[AB]\d{1,5}$',
+            "DE_ID_CARD": r'^[A-Z]\d{8}$',
+            "DE_PASSPORT": r'^[A-Z]{2}\d{7}$',
+            "DE_DRIVING_LICENSE": r'^(DE\d{8}|\d{11})$',
+            "DE_RESIDENCE_PERMIT": r'^[A-Z]\d{9}[A-Z]\d$',
+            "DE_EXPIRY_DATE": r'^\d{2}/\d{2}$',
+        }
+        for entity_type, pattern in expected_formats.items():
+            for _ in range(5):
+                value = self.german_generator.generate_fake_value(entity_type, "original")
+                self.assertTrue(re.match(pattern, value), f"{entity_type}: {value}")
+    
     def test_generate_fake_value_with_unknown_type(self):
         """Test fake value generation with unknown entity type"""
         original_value = "Test Value"
@@ -89,6 +128,60 @@ class TestFakeDataGenerator(unittest.TestCase):
 
         self.assertTrue(re.match(r'^\[UNKNOWN_TYPE_[0-9a-f]{8}\]$', fake_value))
     
+    def test_generate_consistent_fake_value(self):
+        """Test that consistent generation is repeatable, including token generators"""
+        for entity_type in ("PERSON", "CRYPTO_WALLET"):
+            first = self.english_generator.generate_consistent_fake_value(entity_type, "John Smith")
+            second = self.english_generator.generate_consistent_fake_value(entity_type, "John Smith")
+            self.assertEqual(first, second)
+    
+    def test_consistent_generation_leaves_shared_rng_alone(self):
+        """Test that a consistent draw does not touch the shared Faker's RNG"""
+        rng = self.english_generator.fake.random
+        state = rng.getstate()
+        
+        self.english_generator.generate_consistent_fake_value("PERSON", "John Smith")
+        self.english_generator.bulk_generate({"EMAIL_ADDRESS": "john@example.com"})
+        
+        self.assertEqual(rng.getstate(), state)
+    
+    def test_consistent_generation_across_threads(self):
+        """Test that concurrent consistent draws match the serial ones"""
+        values = [f"person {i}" for i in range(200)]
+        expected = [
+            self.german_generator.generate_consistent_fake_value("DE_PERSON_NAME", value)
+            for value in values
+        ]
+        
+        def generate(value):
+            # Interleave plain draws on the shared Faker
+            self.german_generator.generate_fake_value("DE_TAX_ID", value)
+            return self.german_generator.generate_consistent_fake_value("DE_PERSON_NAME", value)
+        
+        # Switch threads often so unsynchronized RNG use would interleave
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(generate, values))
+        finally:
+            sys.setswitchinterval(interval)
+        
+        self.assertEqual(results, expected)
+    
+    def test_bulk_generate_consistent(self):
+        """Test that bulk generation matches per-value consistent generation"""
+        mappings = {"PERSON": "John Smith", "EMAIL_ADDRESS": "john@example.com"}
+        
+        results = self.english_generator.bulk_generate(mappings)
+        
+        self.assertEqual(set(results), {"John Smith", "john@example.com"})
+        for entity_type, original_value in mappings.items():
+            self.assertEqual(
+                results[original_value],
+                self.english_generator.generate_consistent_fake_value(entity_type, original_value)
+            )
+    
     def test_language_specific_generators(self):
         """Test language-specific generators"""
 
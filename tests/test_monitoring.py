@@ -0,0 +1,59 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import modules directly
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from monitoring import PerformanceMonitor
+from core import ProcessingResult
+
+
+class TestPerformanceMonitor(unittest.TestCase):
+    """Test the PerformanceMonitor class"""
+    
+    def setUp(self):
+        """Set up a monitor with two recorded results"""
+        self.monitor = PerformanceMonitor()
+        self.monitor.record_processing(ProcessingResult(
+            anonymized_data="", entities_map={}, metadata={"text_length": 100},
+            processing_time=0.5, cache_hits=1, total_entities=2
+        ))
+        self.monitor.record_processing(ProcessingResult(
+            anonymized_data="", entities_map={}, metadata={"text_length": 300},
+            processing_time=1.5, cache_hits=0, total_entities=4
+        ))
+    
+    def test_get_average_performance(self):
+        """Test aggregate metrics over recorded results"""
+        self.assertEqual(self.monitor.get_average_performance(), {
+            "avg_processing_time": 1.0,
+            "chars_per_second": 200.0,
+            "avg_entities_per_text": 3.0
+        })
+        self.assertEqual(self.monitor.get_total_processed(), 2)
+        self.assertEqual(self.monitor.get_total_entities_found(), 6)
+    
+    def test_metrics_records(self):
+        """Test that metrics are exposed as one dict per record"""
+        metrics = self.monitor.metrics
+        
+        self.assertEqual(len(metrics), 2)
+        self.assertEqual(metrics[1]["text_length"], 300)
+        self.assertEqual(metrics[1]["processing_time"], 1.5)
+        self.assertEqual(metrics[0]["cache_hits"], 1)
+        self.assertIn("timestamp", metrics[0])
+    
+    def test_clear_metrics(self):
+        """Test clearing recorded metrics"""
+        self.monitor.clear_metrics()
+        
+        self.assertEqual(self.monitor.get_average_performance(), {})
+        self.assertEqual(self.monitor.get_total_processed(), 0)
+        self.assertEqual(self.monitor.metrics, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
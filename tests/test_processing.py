@@ -66,6 +66,10 @@ class TestAsyncPIIProcessingEngine(unittest.TestCase):
         # Verify caching works
         generator_en2 = self.engine._get_fake_generator(Language.ENGLISH)
         self.assertIs(generator_en, generator_en2)  # Should be same instance
+        
+        # Generators are shared across engine instances
+        other_engine = AsyncPIIProcessingEngine(self.config)
+        self.assertIs(other_engine._get_fake_generator(Language.ENGLISH), generator_en)
     
     def test_get_entities_to_analyze_from_config(self):
         """Test getting entities from config"""
@@ -0,0 +1,150 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+# Add parent directory to path to import modules directly
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from presidio_analyzer import EntityRecognizer, PatternRecognizer, RecognizerResult
+
+from recognizers_base import CaseFoldedPattern, FastPatternRecognizer, PrecompiledPattern
+
+
+class TestPrecompiledPattern(unittest.TestCase):
+    """Test the PrecompiledPattern class"""
+    
+    def test_validates_with_regex_module(self):
+        """Test that regex-module syntax is accepted and invalid input rejected"""
+        pattern = PrecompiledPattern("atomic", r"\b(?>\d+)\b", 0.5)
+        
+        self.assertEqual(pattern.to_dict(), {"name": "atomic", "score": 0.5, "regex": r"\b(?>\d+)\b"})
+        self.assertEqual(pattern.compiled_regex.flags & pattern.compiled_with_flags, pattern.compiled_with_flags)
+        with self.assertRaises(ValueError):
+            PrecompiledPattern("broken", r"(\d+", 0.5)
+        with self.assertRaises(ValueError):
+            PrecompiledPattern("score", r"\d+", 1.5)
+
+
+class TestCaseFoldedPattern(unittest.TestCase):
+    """Test the CaseFoldedPattern class"""
+    
+    def _spans(self, pattern, text):
+        recognizer = PatternRecognizer(
+            supported_entity="TEST", patterns=[pattern], supported_language="de"
+        )
+        return [(r.start, r.end) for r in recognizer.analyze(text, ["TEST"])]
+    
+    def test_matches_like_case_insensitive_pattern(self):
+        """Test that case-folded matching finds the same spans"""
+        expression = r"(?i)\b(?:steuernummer|st[^\w]*?nr)[\s:]*([A-ZÄÖÜ]\d{3})\b"
+        text = "STEUERNUMMER: Ä123, St.-Nr b456 und steuernummer x789"
+        
+        self.assertEqual(
+            self._spans(CaseFoldedPattern("test", expression, 0.5), text),
+            self._spans(PrecompiledPattern("test", expression, 0.5), text)
+        )
+        self.assertEqual(len(self._spans(CaseFoldedPattern("test", expression, 0.5), text)), 3)
+    
+    def test_falls_back_beyond_latin1(self):
+        """Test that texts outside Latin-1 use the case-insensitive regex"""
+        pattern = CaseFoldedPattern("test", r"\bsteuer\b", 0.5)
+        
+        # 'İ' lowercases to two characters, which would shift offsets
+        self.assertEqual(self._spans(pattern, "İİ STEUER"), [(3, 9)])
+        # Long s case-folds to 's' in the regex engine but not in str.lower()
+        self.assertEqual(self._spans(pattern, "ſteuer"), [(0, 6)])
+    
+    def test_identical_expressions_share_scan(self):
+        """Test that patterns with the same expression scan a text once per analysis"""
+        first = CaseFoldedPattern("first", r"\b\d{5}\b", 0.5)
+        second = CaseFoldedPattern("second", r"\b\d{5}\b", 0.9)
+        text = "PLZ 10115 und 80331"
+        
+        self.assertIs(first.compiled_regex, second.compiled_regex)
+        self.assertEqual(self._spans(first, text), [(4, 9), (14, 19)])
+        self.assertEqual(self._spans(second, text), [(4, 9), (14, 19)])
+        
+        recognizer = FastPatternRecognizer(
+            supported_entity="TEST", patterns=[first, second], supported_language="de"
+        )
+        scanner = first.compiled_regex
+        with patch.object(type(scanner), "scan", wraps=scanner.scan) as scan:
+            results = recognizer.analyze(text, ["TEST"])
+        scan.assert_called_once()
+        self.assertEqual([(r.start, r.end, r.score) for r in results], [(4, 9, 0.9), (14, 19, 0.9)])
+    
+    def test_scanner_honours_arguments(self):
+        """Test that repeated scans of a text honour their arguments"""
+        compiled = CaseFoldedPattern("test", r"\b\d{5}\b", 0.5).compiled_regex
+        text = "PLZ 10115 und 80331"
+        
+        self.assertEqual([m.span() for m in compiled.finditer(text)], [(4, 9), (14, 19)])
+        self.assertEqual([m.span() for m in compiled.finditer(text, 10)], [(14, 19)])
+
+
+
+class TestFastPatternRecognizer(unittest.TestCase):
+    """Test the FastPatternRecognizer class"""
+    
+    def _patterns(self):
+        return [
+            PrecompiledPattern("digits", r"\b\d{4,8}\b", 0.5),
+            PrecompiledPattern("context", r"(?i)\bnr[\s:]*(\d{4,8})\b", 0.9),
+            PrecompiledPattern("pairs", r"\b\d{2}\b", 0.5),
+        ]
+    
+    def test_matches_presidio_results(self):
+        """Test that results equal PatternRecognizer's, in the same order"""
+        text = "Nr: 12345, nr 678901 und 4711 sowie 12 und 34"
+        expected = PatternRecognizer(
+            supported_entity="TEST", patterns=self._patterns(), supported_language="de"
+        ).analyze(text, ["TEST"])
+        results = FastPatternRecognizer(
+            supported_entity="TEST", patterns=self._patterns(), supported_language="de"
+        ).analyze(text, ["TEST"])
+        
+        self.assertEqual(results, expected)
+        self.assertEqual(
+            [r.analysis_explanation.pattern_name for r in results],
+            [r.analysis_explanation.pattern_name for r in expected]
+        )
+    
+    def test_remove_duplicates_matches_presidio(self):
+        """Test de-duplication against presidio's quadratic implementation"""
+        results = [
+            RecognizerResult("TEST", 0, 10, 0.5),
+            RecognizerResult("TEST", 2, 5, 0.9),
+            RecognizerResult("TEST", 2, 5, 0.9),
+            RecognizerResult("TEST", 1, 4, 0.9),
+            RecognizerResult("TEST", 3, 12, 0.5),
+            RecognizerResult("TEST", 4, 6, 0.5),
+            RecognizerResult("TEST", 20, 22, 0.0),
+        ]
+        
+        self.assertEqual(
+            FastPatternRecognizer._remove_duplicates(list(results)),
+            EntityRecognizer.remove_duplicates(list(results))
+        )
+    
+    def test_keywords_gate_pattern(self):
+        """Test that a pattern only scans texts containing one of its keywords"""
+        pattern = CaseFoldedPattern(
+            "context", r"(?i)\b(?:plz|postleitzahl)[\s:]*(\d{5})\b", 0.9,
+            keywords=("plz", "postleitzahl")
+        )
+        recognizer = FastPatternRecognizer(
+            supported_entity="TEST", patterns=[pattern], supported_language="de"
+        )
+        
+        with patch.object(type(pattern.compiled_regex), "scan") as scan:
+            self.assertEqual(recognizer.analyze("Berlin 10115", ["TEST"]), [])
+        scan.assert_not_called()
+        results = recognizer.analyze("POSTLEITZAHL: 10115", ["TEST"])
+        self.assertEqual([(r.start, r.end) for r in results], [(0, 19)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import modules directly
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from recognizers_english import EnglishRecognizers
+
+
+class TestEnglishRecognizers(unittest.TestCase):
+    """Test the EnglishRecognizers patterns"""
+    
+    def _spans(self, text):
+        return sorted(
+            (result.entity_type, result.start, result.end)
+            for recognizer in EnglishRecognizers().get_recognizers()
+            for result in recognizer.analyze(text, recognizer.supported_entities)
+        )
+    
+    def test_detects_ascii_identifiers(self):
+        """Test that wallet addresses and DEA numbers are found"""
+        self.assertIn(("CRYPTO_WALLET", 0, 34), self._spans("1BoatSLRHtKNngkdXEeobR76b53LETtpyT"))
+        self.assertIn(("MEDICAL_LICENSE", 0, 9), self._spans("AB1234567"))
+    
+    def test_accented_letter_is_part_of_the_word(self):
+        """Test that a preceding non-ASCII letter blocks the word boundary"""
+        self.assertEqual(self._spans("é1BoatSLRHtKNngkdXEeobR76b53LETtpyT"), [])
+        self.assertEqual(self._spans("ñAB1234567"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import modules directly
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from recognizers_german import GermanRecognizers
+
+
+class TestGermanRecognizers(unittest.TestCase):
+    """Test the GermanRecognizers patterns"""
+    
+    def _results(self, entity_type, text):
+        recognizer = next(
+            recognizer for recognizer in GermanRecognizers().get_recognizers()
+            if recognizer.supported_entities == [entity_type]
+        )
+        return sorted(
+            (result.start, result.end, result.score)
+            for result in recognizer.analyze(text, [entity_type])
+        )
+    
+    def test_overlapping_card_brands(self):
+        """Test that a card number starting inside another is still reported"""
+        results = self._results("DE_CREDIT_CARD", "4111 5111 1111 1111 1111")
+        
+        self.assertIn((0, 19, 0.95), results)
+        self.assertIn((5, 24, 0.95), results)
+
+
+if __name__ == "__main__":
+    unittest.main()
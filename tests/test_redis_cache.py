@@ -3,6 +3,8 @@ from unittest.mock import patch, MagicMock
 import sys
 import os
 import json
+import threading
+import time
 
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -10,6 +12,7 @@ parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
 from redis_cache import RedisCache
+from core import EntityMatch
 
 
 class TestRedisCache(unittest.TestCase):
@@ -24,13 +27,25 @@ class TestRedisCache(unittest.TestCase):
         self.cache = RedisCache()
 
         from redis_cache import redis
-        redis.Redis.assert_called_once_with(
-            host="localhost",
-            port=6379,
-            db=0,
-            password=None,
-            decode_responses=False
-        )
+        redis.Redis.assert_called_once()
+        pool = self._connection_pool()
+        self.assertIsInstance(pool, redis.ConnectionPool)
+        expected = {
+            'host': "localhost",
+            'port': 6379,
+            'db': 0,
+            'password': None,
+            'socket_connect_timeout': 1.0,
+            'socket_timeout': 1.0,
+            'decode_responses': False,
+        }
+        for name, value in expected.items():
+            self.assertEqual(pool.connection_kwargs[name], value)
+    
+    def _connection_pool(self):
+        """Connection pool passed to the most recent redis.Redis call"""
+        from redis_cache import redis
+        return redis.Redis.call_args[1]['connection_pool']
     
     def tearDown(self):
         """Clean up after each test"""
@@ -50,17 +65,44 @@ class TestRedisCache(unittest.TestCase):
             expiration_time=7200
         )
 
-        redis.Redis.assert_called_once_with(
-            host="redis.example.com",
-            port=6380,
-            db=1,
-            password="secret",
-            decode_responses=False
-        )
+        redis.Redis.assert_called_once()
+        connection_kwargs = self._connection_pool().connection_kwargs
+        self.assertEqual(connection_kwargs['host'], "redis.example.com")
+        self.assertEqual(connection_kwargs['port'], 6380)
+        self.assertEqual(connection_kwargs['db'], 1)
+        self.assertEqual(connection_kwargs['password'], "secret")
 
         self.assertEqual(custom_cache._key_prefix, "custom:")
         self.assertEqual(custom_cache._expiration_time, 7200)
     
+    def test_initialization_with_socket_and_pool_size(self):
+        """Test UNIX socket and pool size configuration from the environment"""
+        from redis_cache import redis
+        redis.Redis.reset_mock()
+        
+        with patch.dict(os.environ, {'REDIS_UNIX_SOCKET': '/run/redis.sock', 'REDIS_POOL_SIZE': '16'}):
+            RedisCache()
+        
+        pool = self._connection_pool()
+        self.assertIsInstance(pool, redis.BlockingConnectionPool)
+        self.assertEqual(pool.max_connections, 16)
+        self.assertIs(pool.connection_class, redis.UnixDomainSocketConnection)
+        self.assertEqual(pool.connection_kwargs['path'], '/run/redis.sock')
+        self.assertNotIn('host', pool.connection_kwargs)
+    
+    def test_saturated_pool_waits_for_connection(self):
+        """Test that an exhausted bounded pool blocks instead of raising"""
+        RedisCache(max_connections=1)
+        pool = self._connection_pool()
+        pool.make_connection = lambda: MagicMock(pid=pool.pid, **{'can_read.return_value': False})
+        
+        held = pool.get_connection()
+        threading.Timer(0.1, pool.release, args=(held,)).start()
+        start = time.monotonic()
+        # Blocks until the held connection is released rather than raising
+        self.assertIs(pool.get_connection(), held)
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+    
     def test_format_key(self):
         """Test key formatting with prefix"""
 
@@ -70,6 +112,15 @@ class TestRedisCache(unittest.TestCase):
         custom_cache = RedisCache(key_prefix="custom:")
         self.assertEqual(custom_cache._format_key("test_key"), "custom:test_key")
     
+    def test_format_long_key(self):
+        """Test that long keys are hashed to a fixed-size digest"""
+        long_key = "x" * 65
+        formatted = self.cache._format_key(long_key)
+        
+        self.assertEqual(len(formatted), len("pii_anonymizer:") + 32)
+        self.assertEqual(formatted, self.cache._format_key(long_key))
+        self.assertNotEqual(formatted, self.cache._format_key("y" * 65))
+    
     def test_get_existing_value(self):
         """Test getting an existing value from cache"""
 
@@ -107,6 +158,114 @@ class TestRedisCache(unittest.TestCase):
 
         self.assertIsNone(result)
     
+    def test_get_serves_hot_keys_locally(self):
+        """Test that repeated gets of a key make one Redis round trip"""
+        test_data = {"name": "John", "age": 30}
+        self.redis_mock.get.return_value = json.dumps(test_data).encode()
+        
+        self.assertEqual(self.cache.get("test_key"), test_data)
+        self.assertEqual(self.cache.get("test_key"), test_data)
+        
+        self.redis_mock.get.assert_called_once_with("pii_anonymizer:test_key")
+    
+    def test_local_cache_matches_redis_round_trip(self):
+        """Test that local hits return what a Redis hit would, not the caller's object"""
+        value = {"span": (0, 10), "scores": (0.5, 0.9)}
+        self.cache.set("test_key", value)
+        self.cache.set_many({"other_key": ("a", "b")})
+        
+        serialized = self.redis_mock.setex.call_args[0][2]
+        self.redis_mock.get.return_value = serialized
+        from_redis = RedisCache(local_maxsize=0).get("test_key")
+        
+        self.assertEqual(from_redis, {"span": [0, 10], "scores": [0.5, 0.9]})
+        self.assertEqual(self.cache.get("test_key"), from_redis)
+        self.assertEqual(self.cache.get("other_key"), ["a", "b"])
+    
+    def test_set_writes_through_local_cache(self):
+        """Test that a set value is read back without Redis until cleared"""
+        test_data = {"name": "John", "age": 30}
+        self.cache.set("test_key", test_data)
+        
+        self.assertEqual(self.cache.get("test_key"), test_data)
+        self.redis_mock.get.assert_not_called()
+        
+        self.redis_mock.scan.return_value = (0, [])
+        self.redis_mock.get.return_value = None
+        self.cache.clear()
+        self.assertIsNone(self.cache.get("test_key"))
+    
+    def test_expired_local_entry_goes_to_redis(self):
+        """Test that a local entry past its TTL is fetched from Redis again"""
+        cache = RedisCache(local_ttl=5)
+        self.redis_mock.get.return_value = json.dumps({"id": 2}).encode()
+        
+        with patch('redis_cache.time.monotonic', return_value=100.0):
+            cache.set("test_key", {"id": 1})
+            self.assertEqual(cache.get("test_key"), {"id": 1})
+        self.redis_mock.get.assert_not_called()
+        
+        with patch('redis_cache.time.monotonic', return_value=105.0):
+            self.assertEqual(cache.get("test_key"), {"id": 2})
+            self.assertEqual(cache.get("test_key"), {"id": 2})
+        self.redis_mock.get.assert_called_once_with("pii_anonymizer:test_key")
+    
+    def test_local_ttl_capped_by_expiration(self):
+        """Test that local entries never outlive the Redis expiration"""
+        self.assertEqual(RedisCache(expiration_time=10, local_ttl=60)._local_ttl, 10)
+        self.assertEqual(RedisCache(expiration_time=3600, local_ttl=60)._local_ttl, 60)
+    
+    def test_local_cache_disabled(self):
+        """Test that local_maxsize=0 sends every get to Redis"""
+        cache = RedisCache(local_maxsize=0)
+        self.redis_mock.get.return_value = b"1"
+        
+        cache.get("test_key")
+        cache.get("test_key")
+        
+        self.assertEqual(self.redis_mock.get.call_count, 2)
+    
+    def test_get_many(self):
+        """Test that local misses are fetched with one MGET, in key order"""
+        self.cache.set("local_key", {"id": 1})
+        self.redis_mock.mget.return_value = [json.dumps({"id": 2}).encode(), None]
+        
+        values = self.cache.get_many(["remote_key", "local_key", "missing_key"])
+        
+        self.assertEqual(values, [{"id": 2}, {"id": 1}, None])
+        self.redis_mock.mget.assert_called_once_with(
+            ["pii_anonymizer:remote_key", "pii_anonymizer:missing_key"]
+        )
+        self.assertEqual(self.cache.get("remote_key"), {"id": 2})
+    
+    def test_set_many(self):
+        """Test that several values are written through one pipeline"""
+        self.cache.set_many({"key1": {"id": 1}, "key2": lambda x: x, "key3": [3]})
+        
+        pipe = self.redis_mock.pipeline.return_value
+        self.assertEqual(
+            [call[0][0] for call in pipe.setex.call_args_list],
+            ["pii_anonymizer:key1", "pii_anonymizer:key3"]
+        )
+        pipe.execute.assert_called_once()
+        self.assertEqual(self.cache.get_many(["key1", "key3"]), [{"id": 1}, [3]])
+        self.redis_mock.mget.assert_not_called()
+    
+    def test_redis_errors_open_circuit(self):
+        """Test that failing Redis calls become misses and then stop"""
+        from redis_cache import redis
+        self.redis_mock.get.side_effect = redis.ConnectionError("down")
+        
+        for index in range(5):
+            self.assertIsNone(self.cache.get(f"key{index}"))
+        self.assertEqual(self.redis_mock.get.call_count, 5)
+        
+        # The circuit is open: no further round trips, writes are dropped
+        self.assertIsNone(self.cache.get("key5"))
+        self.cache.set("key6", {"id": 6})
+        self.assertEqual(self.redis_mock.get.call_count, 5)
+        self.redis_mock.setex.assert_not_called()
+    
     def test_set_with_expiration(self):
         """Test setting a value with expiration"""
         # Set value in cache
@@ -114,11 +273,11 @@ class TestRedisCache(unittest.TestCase):
         self.cache.set("test_key", test_data)
         
         # Verify Redis setex was called with correct parameters
-        self.redis_mock.setex.assert_called_once_with(
-            "pii_anonymizer:test_key",
-            3600,  # Default expiration time
-            json.dumps(test_data)
-        )
+        self.redis_mock.setex.assert_called_once()
+        key, expiration, serialized = self.redis_mock.setex.call_args[0]
+        self.assertEqual(key, "pii_anonymizer:test_key")
+        self.assertEqual(expiration, 3600)  # Default expiration time
+        self.assertEqual(json.loads(serialized), test_data)
     
     def test_set_without_expiration(self):
         """Test setting a value without expiration"""
@@ -131,10 +290,22 @@ class TestRedisCache(unittest.TestCase):
             no_expiration_cache.set("test_key", test_data)
             
             # Verify Redis set was called with correct parameters
-            self.redis_mock.set.assert_called_once_with(
-                "pii_anonymizer:test_key",
-                json.dumps(test_data)
-            )
+            self.redis_mock.set.assert_called_once()
+            key, serialized = self.redis_mock.set.call_args[0]
+            self.assertEqual(key, "pii_anonymizer:test_key")
+            self.assertEqual(json.loads(serialized), test_data)
+    
+    def test_large_value_round_trip(self):
+        """Test that large values are stored compressed and read back"""
+        cache = RedisCache(local_maxsize=0)
+        test_data = [{"entity_type": "PERSON", "start": i, "end": i + 4} for i in range(100)]
+        
+        cache.set("test_key", test_data)
+        serialized = self.redis_mock.setex.call_args[0][2]
+        self.assertLess(len(serialized), len(json.dumps(test_data)))
+        
+        self.redis_mock.get.return_value = serialized
+        self.assertEqual(cache.get("test_key"), test_data)
     
     def test_set_non_serializable_value(self):
         """Test setting a value that can't be serialized"""
@@ -148,6 +319,15 @@ class TestRedisCache(unittest.TestCase):
         self.redis_mock.setex.assert_not_called()
         self.redis_mock.set.assert_not_called()
     
+    def test_set_dataclass_value(self):
+        """Test that dataclasses are not cached, with either JSON codec"""
+        match = EntityMatch(entity_type="PERSON", start=0, end=4, text="John", confidence=0.9)
+        
+        self.cache.set("test_key", [match])
+        
+        self.redis_mock.setex.assert_not_called()
+        self.redis_mock.set.assert_not_called()
+    
     def test_clear(self):
         """Test clearing all keys with prefix"""
         # Set up mock to return keys in batches
@@ -160,12 +340,16 @@ class TestRedisCache(unittest.TestCase):
         self.cache.clear()
         
         # Verify Redis scan was called with correct pattern
-        self.redis_mock.scan.assert_any_call(0, "pii_anonymizer:*", 100)
-        self.redis_mock.scan.assert_any_call(1, "pii_anonymizer:*", 100)
+        self.redis_mock.scan.assert_any_call(0, "pii_anonymizer:*", 1000)
+        self.redis_mock.scan.assert_any_call(1, "pii_anonymizer:*", 1000)
         
-        # Verify Redis delete was called with correct keys
-        self.redis_mock.delete.assert_any_call(b"pii_anonymizer:key1", b"pii_anonymizer:key2")
-        self.redis_mock.delete.assert_any_call(b"pii_anonymizer:key3")
+        # Verify the keys were unlinked through one non-transactional pipeline
+        self.redis_mock.pipeline.assert_called_once_with(transaction=False)
+        pipe = self.redis_mock.pipeline.return_value
+        pipe.unlink.assert_any_call(b"pii_anonymizer:key1", b"pii_anonymizer:key2")
+        pipe.unlink.assert_any_call(b"pii_anonymizer:key3")
+        pipe.execute.assert_called_once()
+        self.redis_mock.delete.assert_not_called()
 
 
 if __name__ == "__main__":